@@ -11,12 +11,113 @@ Communications Admin Configuration
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.cache import cache
 from .models import User, Message, Report
+from apps.core.signals import invalidate_user_dashboards
+from .signals import invalidate_unread_counts
+
+
+# Поля пользователя, нужные для User.__str__ (ФИО, логин, роль)
+USER_STR_FIELDS = ('username', 'first_name', 'last_name', 'role')
+
+
+# ===== CHANGELIST PROJECTION =====
+class ChangelistOnlyMixin:
+    """
+    Ограничивает выборку списка (changelist) колонками из changelist_only_fields.
+
+    Форма редактирования и удаление получают полную модель — иначе каждое
+    отложенное поле догружалось бы отдельным запросом.
+    """
+
+    changelist_only_fields = ()
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        match = request.resolver_match
+        if self.changelist_only_fields and match and match.url_name.endswith('_changelist'):
+            qs = qs.only(*self.changelist_only_fields)
+        return qs
+
+
+# ===== CACHED RELATED FILTERS =====
+class CachedUserListFilter(admin.SimpleListFilter):
+    """
+    Фильтр по FK на пользователя со списком вариантов из кэша.
+
+    RelatedOnlyFieldListFilter выполняет SELECT DISTINCT по всей таблице
+    при каждом открытии списка; здесь варианты пересчитываются раз в
+    FILTER_CACHE_TIMEOUT секунд. Имя GET-параметра совпадает со стандартным
+    (<поле>__id__exact), поэтому старые ссылки продолжают работать.
+    """
+
+    field_name = None
+    FILTER_CACHE_TIMEOUT = 300  # 5 минут
+    FILTER_MAX_CHOICES = 200
+
+    def __init__(self, request, params, model, model_admin):
+        self.parameter_name = f'{self.field_name}__id__exact'
+        super().__init__(request, params, model, model_admin)
+
+    def lookups(self, request, model_admin):
+        model = model_admin.model
+        cache_key = f'admin:filter:{model._meta.label_lower}:{self.field_name}'
+
+        def load():
+            used_ids = model._default_manager.order_by().values(f'{self.field_name}_id').distinct()
+            users = (
+                User.objects
+                .filter(id__in=used_ids)
+                .order_by('last_name', 'first_name', 'username')
+                .values_list('id', 'username', 'first_name', 'last_name')[:self.FILTER_MAX_CHOICES]
+            )
+            return [
+                (str(pk), f'{first} {last}'.strip() or username)
+                for pk, username, first, last in users
+            ]
+
+        return cache.get_or_set(cache_key, load, self.FILTER_CACHE_TIMEOUT)
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value and value.isascii() and value.isdigit():
+            return queryset.filter(**{f'{self.field_name}_id': int(value)})
+        return queryset
+
+
+class SenderListFilter(CachedUserListFilter):
+    title = 'Отправитель'
+    field_name = 'sender'
+
+
+class RecipientListFilter(CachedUserListFilter):
+    title = 'Получатель'
+    field_name = 'recipient'
+
+
+class EmployeeListFilter(CachedUserListFilter):
+    title = 'Сотрудник'
+    field_name = 'employee'
+
+
+# ===== ATTACHMENT COLUMN =====
+class AttachmentFlagMixin:
+    """
+    Колонка «есть вложение» для списков моделей с полем attachment.
+
+    Само поле attachment в list_display не добавляем: FieldFile.url/size
+    обращаются к хранилищу (os.stat, подпись ссылки S3) на каждую строку.
+    Флаг строится только по имени файла из БД — без обращений к хранилищу.
+    """
+
+    @admin.display(boolean=True, description='Вложение')
+    def has_attachment(self, obj):
+        return bool(obj.attachment.name)
 
 
 # ===== CUSTOM USER ADMIN =====
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(ChangelistOnlyMixin, BaseUserAdmin):
     """
     Расширенная админ-панель для User модели с поддержкой ролей.
     """
@@ -31,6 +132,13 @@ class UserAdmin(BaseUserAdmin):
         'created_at'
     )
     
+    # Колонки, которые реально читает список (list_display + get_full_name)
+    changelist_only_fields = USER_STR_FIELDS + ('email', 'is_active', 'created_at')
+    
+    # Пагинация без второго COUNT(*) по всей таблице
+    list_per_page = 50
+    show_full_result_count = False
+    
     # Фильтры в боковой панели
     list_filter = (
         'role',
@@ -83,7 +191,7 @@ class UserAdmin(BaseUserAdmin):
 
 # ===== MESSAGE ADMIN =====
 @admin.register(Message)
-class MessageAdmin(admin.ModelAdmin):
+class MessageAdmin(ChangelistOnlyMixin, AttachmentFlagMixin, admin.ModelAdmin):
     """
     Админ-панель для сообщений.
     """
@@ -94,15 +202,31 @@ class MessageAdmin(admin.ModelAdmin):
         'sender',
         'recipient',
         'is_read',
+        'has_attachment',
         'created_at',
     )
     
+    # Отправитель и получатель подтягиваются JOIN'ом (без запроса на строку)
+    list_select_related = ('sender', 'recipient')
+    
+    # Выбор пользователей через AJAX-поиск (search_fields UserAdmin), а не <select> со всеми строками
+    autocomplete_fields = ('sender', 'recipient')
+    changelist_only_fields = (
+        'subject', 'is_read', 'attachment', 'created_at',
+        *(f'sender__{f}' for f in USER_STR_FIELDS),
+        *(f'recipient__{f}' for f in USER_STR_FIELDS),
+    )
+    
+    # Пагинация без второго COUNT(*) по всей таблице
+    list_per_page = 50
+    show_full_result_count = False
+    
     # Фильтры в боковой панели
     list_filter = (
         'is_read',
         'created_at',
-        ('sender', admin.RelatedOnlyFieldListFilter),
-        ('recipient', admin.RelatedOnlyFieldListFilter),
+        SenderListFilter,
+        RecipientListFilter,
     )
     
     # Поиск
@@ -142,20 +266,28 @@ class MessageAdmin(admin.ModelAdmin):
     
     def mark_as_read(self, request, queryset):
         """Пометить сообщения как прочитанные"""
+        recipient_ids = set(queryset.values_list('recipient_id', flat=True))
         updated = queryset.update(is_read=True)
+        # update() не отправляет post_save — счётчики и дашборды получателей сбрасываем вручную
+        invalidate_unread_counts(recipient_ids)
+        invalidate_user_dashboards(*recipient_ids)
         self.message_user(request, f'{updated} сообщений помечено как прочитанные.')
     mark_as_read.short_description = 'Пометить как прочитанные'
     
     def mark_as_unread(self, request, queryset):
         """Пометить сообщения как непрочитанные"""
+        recipient_ids = set(queryset.values_list('recipient_id', flat=True))
         updated = queryset.update(is_read=False)
+        # update() не отправляет post_save — счётчики и дашборды получателей сбрасываем вручную
+        invalidate_unread_counts(recipient_ids)
+        invalidate_user_dashboards(*recipient_ids)
         self.message_user(request, f'{updated} сообщений помечено как непрочитанные.')
     mark_as_unread.short_description = 'Пометить как непрочитанные'
 
 
 # ===== REPORT ADMIN =====
 @admin.register(Report)
-class ReportAdmin(admin.ModelAdmin):
+class ReportAdmin(ChangelistOnlyMixin, AttachmentFlagMixin, admin.ModelAdmin):
     """
     Админ-панель для отчетов.
     """
@@ -166,15 +298,30 @@ class ReportAdmin(admin.ModelAdmin):
         'employee',
         'report_type',
         'status',
+        'has_attachment',
         'created_at',
     )
     
+    # Сотрудник подтягивается JOIN'ом (без запроса на строку)
+    list_select_related = ('employee',)
+    
+    # Выбор сотрудника через AJAX-поиск (search_fields UserAdmin), а не <select> со всеми строками
+    autocomplete_fields = ('employee',)
+    changelist_only_fields = (
+        'title', 'report_type', 'status', 'attachment', 'created_at',
+        *(f'employee__{f}' for f in USER_STR_FIELDS),
+    )
+    
+    # Пагинация без второго COUNT(*) по всей таблице
+    list_per_page = 50
+    show_full_result_count = False
+    
     # Фильтры в боковой панели
     list_filter = (
         'report_type',
         'status',
         'created_at',
-        ('employee', admin.RelatedOnlyFieldListFilter),
+        EmployeeListFilter,
     )
     
     # Поиск
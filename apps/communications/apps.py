@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CommunicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.communications'
+
+    def ready(self):
+        # Регистрация обработчиков сигналов (сброс кэша счётчика непрочитанных)
+        from . import signals  # noqa: F401
@@ -15,6 +15,8 @@
 """
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from apps.communications.models import User, Message, Report
@@ -26,9 +28,13 @@ class Command(BaseCommand):
     """
     help = 'Создаёт группы пользователей и назначает права доступа (RBAC)'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         """
         Основной метод команды. Создаёт 3 группы с соответствующими правами.
+
+        Выполняется в одной транзакции: при ошибке группы не остаются
+        в частично настроенном состоянии.
         """
 
         # ═════════════════════════════════════════════════════════════════
@@ -37,17 +43,20 @@ class Command(BaseCommand):
         
         admins_group, created = Group.objects.get_or_create(name='Администраторы')
         
-        # Получаем ContentType для моделей
-        user_content_type = ContentType.objects.get_for_model(User)
-        message_content_type = ContentType.objects.get_for_model(Message)
-        report_content_type = ContentType.objects.get_for_model(Report)
+        # Получаем ContentType для моделей (одним запросом, с кэшем ContentType)
+        content_types = ContentType.objects.get_for_models(User, Message, Report).values()
+
+        # Все права на эти модели — одним запросом; группы ниже берут из словаря
+        permissions_by_codename = {
+            perm.codename: perm
+            for perm in Permission.objects.filter(content_type__in=content_types)
+        }
 
         # Администраторы получают ВСЕ права на эти модели
-        admin_permissions = Permission.objects.filter(
-            content_type__in=[user_content_type, message_content_type, report_content_type]
-        )
+        admin_permissions = list(permissions_by_codename.values())
         
-        admins_group.permissions.set(admin_permissions)
+        # Права всех групп применяются одним пакетом в конце (см. _sync_permissions)
+        wanted_permissions = {admins_group.id: admin_permissions}
         
         if created:
             self.stdout.write(
@@ -69,19 +78,17 @@ class Command(BaseCommand):
         # - Просматривать сообщения
         # - Создавать и редактировать отчеты
         # - Просматривать пользователей (для адресации сообщений)
-        staff_permissions = Permission.objects.filter(
-            codename__in=[
-                'add_message',      # Отправлять сообщения
-                'change_message',   # Редактировать свои сообщения
-                'view_message',     # Просматривать сообщения
-                'add_report',       # Создавать отчеты
-                'change_report',    # Редактировать отчеты
-                'view_report',      # Просматривать отчеты
-                'view_user',        # Просматривать пользователей
-            ]
-        )
+        staff_permissions = self._pick_permissions(permissions_by_codename, [
+            'add_message',      # Отправлять сообщения
+            'change_message',   # Редактировать свои сообщения
+            'view_message',     # Просматривать сообщения
+            'add_report',       # Создавать отчеты
+            'change_report',    # Редактировать отчеты
+            'view_report',      # Просматривать отчеты
+            'view_user',        # Просматривать пользователей
+        ])
         
-        staff_group.permissions.set(staff_permissions)
+        wanted_permissions[staff_group.id] = staff_permissions
         
         if created:
             self.stdout.write(
@@ -102,15 +109,13 @@ class Command(BaseCommand):
         # - Просматривать свои сообщения от сотрудников
         # - Отправлять ответы на сообщения
         # - Просматривать отчеты о своих детях
-        parent_permissions = Permission.objects.filter(
-            codename__in=[
-                'view_message',     # Просматривать свои сообщения
-                'add_message',      # Отправлять ответы
-                'view_report',      # Просматривать отчеты о детях
-            ]
-        )
+        parent_permissions = self._pick_permissions(permissions_by_codename, [
+            'view_message',     # Просматривать свои сообщения
+            'add_message',      # Отправлять ответы
+            'view_report',      # Просматривать отчеты о детях
+        ])
         
-        parents_group.permissions.set(parent_permissions)
+        wanted_permissions[parents_group.id] = parent_permissions
         
         if created:
             self.stdout.write(
@@ -121,6 +126,8 @@ class Command(BaseCommand):
                 self.style.WARNING('⚠️  Группа "Родители" уже существует, права обновлены')
             )
 
+        self._sync_permissions(wanted_permissions)
+
         # ═════════════════════════════════════════════════════════════════
         # ✅ ИТОГ
         # ═════════════════════════════════════════════════════════════════
@@ -133,3 +140,52 @@ class Command(BaseCommand):
                 '   Родители:        Просмотр своих сообщений и отчетов о детях\n'
             )
         )
+
+    def _pick_permissions(self, permissions_by_codename, codenames):
+        """
+        Права по списку codename. Отсутствующие (свежая БД до создания прав)
+        пропускаются с предупреждением — группа их не получает.
+        """
+        picked = []
+        for codename in codenames:
+            permission = permissions_by_codename.get(codename)
+            if permission is None:
+                self.stdout.write(self.style.WARNING(f'⚠️  Право "{codename}" не найдено, пропущено'))
+            else:
+                picked.append(permission)
+        return picked
+
+    def _sync_permissions(self, wanted_permissions):
+        """
+        Приводит права групп к нужному набору одним пакетом для всех групп.
+
+        Вместо permissions.set() на каждую группу: один SELECT текущих связей,
+        один bulk_create недостающих и один DELETE лишних. Неизменные строки
+        не трогаются — повторный запуск команды ничего не пишет в БД.
+        """
+        through = Group.permissions.through
+
+        wanted = {
+            (group_id, perm.id)
+            for group_id, perms in wanted_permissions.items()
+            for perm in perms
+        }
+        current = set(
+            through.objects
+            .filter(group_id__in=wanted_permissions)
+            .values_list('group_id', 'permission_id')
+        )
+
+        to_add = sorted(wanted - current)
+        if to_add:
+            through.objects.bulk_create(
+                [through(group_id=group_id, permission_id=perm_id) for group_id, perm_id in to_add],
+                ignore_conflicts=True,
+            )
+
+        to_remove = current - wanted
+        if to_remove:
+            stale = Q()
+            for group_id, perm_id in to_remove:
+                stale |= Q(group_id=group_id, permission_id=perm_id)
+            through.objects.filter(stale).delete()
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0002_message_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['employee', '-created_at'], name='report_employee_recent'),
+        ),
+    ]
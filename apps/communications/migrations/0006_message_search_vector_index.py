@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:25
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0005_user_phone_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('subject', 'content', config='russian'), name='msg_search_vector'),
+        ),
+    ]
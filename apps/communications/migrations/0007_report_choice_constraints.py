@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communications', '0006_message_search_vector_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(condition=models.Q(('status', 'draft')), fields=['employee', '-created_at'], name='report_employee_drafts'),
+        ),
+        migrations.AddConstraint(
+            model_name='report',
+            constraint=models.CheckConstraint(condition=models.Q(('report_type__in', ['progress', 'behavior', 'absence', 'discipline', 'achievement', 'other'])), name='report_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='report',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['draft', 'published', 'archived'])), name='report_status_valid'),
+        ),
+    ]
@@ -9,8 +9,16 @@ Communications Models
 - Report: Отчеты о студентах (успеваемость, поведение, пропуски)
 """
 
-from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db import models
+from django.db.models.functions import Upper
+
+
+# Выражение полнотекстового поиска сообщений (общее для индекса и запросов)
+MESSAGE_SEARCH_CONFIG = 'russian'
+MESSAGE_SEARCH_VECTOR = SearchVector('subject', 'content', config=MESSAGE_SEARCH_CONFIG)
 
 
 # ===== USER MODEL (Расширенная) =====
@@ -75,6 +83,14 @@ class User(AbstractUser):
         verbose_name_plural = 'Пользователи'
         indexes = [
             models.Index(fields=['role', 'is_active']),
+            # Триграммные GIN-индексы под icontains-поиск UserListView
+            # (Django строит его как UPPER(col) LIKE UPPER('%...%'))
+            GinIndex(OpClass(Upper('username'), name='gin_trgm_ops'), name='user_username_trgm'),
+            GinIndex(OpClass(Upper('first_name'), name='gin_trgm_ops'), name='user_first_name_trgm'),
+            GinIndex(OpClass(Upper('last_name'), name='gin_trgm_ops'), name='user_last_name_trgm'),
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='user_email_trgm'),
+            # phone — в search_fields UserAdmin (автодополнение в сообщениях/отчётах)
+            GinIndex(OpClass(Upper('phone'), name='gin_trgm_ops'), name='user_phone_trgm'),
         ]
 
 
@@ -143,10 +159,39 @@ class Message(models.Model):
         indexes = [
             models.Index(fields=['recipient', 'is_read']),
             models.Index(fields=['created_at']),
+            # Переписка двух пользователей и ленты «последние сообщения»
+            models.Index(fields=['sender', 'recipient', '-created_at'], name='msg_pair_recent'),
+            models.Index(fields=['recipient', '-created_at'], name='msg_recipient_recent'),
+            models.Index(fields=['sender', '-created_at'], name='msg_sender_recent'),
+            # Частичный индекс только по непрочитанным: счётчики и группировка по отправителю
+            models.Index(
+                fields=['recipient', 'sender'],
+                condition=models.Q(is_read=False),
+                name='msg_unread',
+            ),
+            # Полнотекстовый поиск по теме и тексту (MessageListView).
+            # Выражение должно совпадать с MESSAGE_SEARCH_VECTOR — иначе индекс не используется.
+            GinIndex(MESSAGE_SEARCH_VECTOR, name='msg_search_vector'),
         ]
 
 
 # ===== REPORT MODEL =====
+# Choices вынесены на уровень модуля: на них ссылаются CheckConstraint в Report.Meta
+REPORT_TYPE_CHOICES = [
+    ('progress', 'Успеваемость'),
+    ('behavior', 'Поведение'),
+    ('absence', 'Пропуски'),
+    ('discipline', 'Дисциплина'),
+    ('achievement', 'Достижения'),
+    ('other', 'Другое'),
+]
+
+REPORT_STATUS_CHOICES = [
+    ('draft', 'Черновик'),
+    ('published', 'Опубликовано'),
+    ('archived', 'В архиве'),
+]
+
 class Report(models.Model):
     """
     Модель отчетов сотрудников о студентах.
@@ -158,20 +203,8 @@ class Report(models.Model):
     - Прочих замечаний и информации
     """
     
-    REPORT_TYPE_CHOICES = [
-        ('progress', 'Успеваемость'),
-        ('behavior', 'Поведение'),
-        ('absence', 'Пропуски'),
-        ('discipline', 'Дисциплина'),
-        ('achievement', 'Достижения'),
-        ('other', 'Другое'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('draft', 'Черновик'),
-        ('published', 'Опубликовано'),
-        ('archived', 'В архиве'),
-    ]
+    REPORT_TYPE_CHOICES = REPORT_TYPE_CHOICES
+    STATUS_CHOICES = REPORT_STATUS_CHOICES
     
     # Связи
     employee = models.ForeignKey(
@@ -236,5 +269,24 @@ class Report(models.Model):
         indexes = [
             models.Index(fields=['employee', 'status']),
             models.Index(fields=['created_at']),
+            # Список отчётов сотрудника (ReportListView): фильтр + сортировка по индексу
+            models.Index(fields=['employee', '-created_at'], name='report_employee_recent'),
+            # Черновики сотрудника — самый частый фильтр списка; частичный индекс мал
+            models.Index(
+                fields=['employee', '-created_at'],
+                condition=models.Q(status='draft'),
+                name='report_employee_drafts',
+            ),
+        ]
+        constraints = [
+            # Значения только из choices — планировщик и индексы видят закрытый набор
+            models.CheckConstraint(
+                condition=models.Q(report_type__in=[code for code, _ in REPORT_TYPE_CHOICES]),
+                name='report_type_valid',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(status__in=[code for code, _ in REPORT_STATUS_CHOICES]),
+                name='report_status_valid',
+            ),
         ]
 
@@ -0,0 +1,44 @@
+"""
+Сигналы приложения communications.
+
+Сбрасывают закэшированный счётчик непрочитанных сообщений получателя.
+Счётчик общий для бейджа входящих и дашбордов — см. get_unread_count().
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Message
+
+
+def unread_count_cache_key(user_id):
+    """Ключ кэша числа непрочитанных входящих пользователя."""
+    return f'communications:unread:{user_id}'
+
+
+# Время жизни закэшированного счётчика непрочитанных (секунды)
+UNREAD_COUNT_CACHE_TIMEOUT = 30
+
+
+def get_unread_count(user_id):
+    """Число непрочитанных входящих пользователя (кэш с коротким TTL)."""
+    return cache.get_or_set(
+        unread_count_cache_key(user_id),
+        lambda: Message.objects.filter(recipient_id=user_id, is_read=False).count(),
+        UNREAD_COUNT_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_unread_counts(user_ids):
+    """
+    Сбрасывает счётчики нескольких получателей — для bulk_create/update,
+    которые не отправляют post_save.
+    """
+    cache.delete_many([unread_count_cache_key(user_id) for user_id in user_ids])
+
+
+@receiver([post_save, post_delete], sender=Message)
+def invalidate_unread_count(sender, instance, **kwargs):
+    """Новое/прочитанное/удалённое сообщение меняет счётчик получателя."""
+    cache.delete(unread_count_cache_key(instance.recipient_id))
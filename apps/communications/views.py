@@ -30,12 +30,29 @@ from django.views.generic import (
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib import messages
-from django.db.models import Q
+from django.contrib.messages.views import SuccessMessageMixin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.core.cache import cache
 from django.utils import timezone
-from .models import User, Message, Report
+from django.utils.functional import cached_property
+from apps.core.signals import invalidate_user_dashboards
+from .models import MESSAGE_SEARCH_CONFIG, MESSAGE_SEARCH_VECTOR, User, Message, Report
+from .signals import get_unread_count, unread_count_cache_key
 from .forms import CustomUserCreationForm, UserEditForm, MessageForm, ReportForm
 
 
+# Допустимые значения фильтров (собираются один раз при импорте)
+_VALID_ROLES = frozenset(code for code, _ in User.ROLE_CHOICES)
+_VALID_REPORT_TYPES = frozenset(code for code, _ in Report.REPORT_TYPE_CHOICES)
+_VALID_REPORT_STATUSES = frozenset(code for code, _ in Report.STATUS_CHOICES)
+
+# Крупные поля, которые списки сообщений/отчётов не выводят
+LIST_DEFERRED_FIELDS = ('content', 'attachment')
+
+
 # ===== USER VIEWS =====
 
 class UserListView(LoginRequiredMixin, ListView):
@@ -55,9 +72,10 @@ class UserListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         """Получает queryset с фильтрацией и поиском"""
         queryset = User.objects.all().order_by('-created_at')
+        params = self.request.GET
         
         # Поиск по ФИО, username, email
-        search = self.request.GET.get('search', '').strip()
+        self._search = search = params.get('search', '').strip()
         if search:
             queryset = queryset.filter(
                 Q(first_name__icontains=search) |
@@ -67,12 +85,12 @@ class UserListView(LoginRequiredMixin, ListView):
             )
         
         # Фильтр по ролям
-        role = self.request.GET.get('role', '').strip()
-        if role and role in [r[0] for r in User.ROLE_CHOICES]:
+        self._role = role = params.get('role', '').strip()
+        if role in _VALID_ROLES:
             queryset = queryset.filter(role=role)
         
         # Фильтр по статусу активности
-        is_active = self.request.GET.get('is_active', '').strip()
+        self._is_active = is_active = params.get('is_active', '').strip()
         if is_active == 'yes':
             queryset = queryset.filter(is_active=True)
         elif is_active == 'no':
@@ -83,13 +101,20 @@ class UserListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         """Добавляет параметры фильтра в контекст"""
         context = super().get_context_data(**kwargs)
-        context['search'] = self.request.GET.get('search', '')
-        context['role'] = self.request.GET.get('role', '')
-        context['is_active'] = self.request.GET.get('is_active', '')
+        # Значения уже разобраны в get_queryset()
+        context['search'] = self._search
+        context['role'] = self._role
+        context['is_active'] = self._is_active
         context['roles'] = User.ROLE_CHOICES
         return context
 
 
+def _count_subquery(queryset, group_field):
+    """COUNT(*) по связанной таблице как скалярный подзапрос (0, если строк нет)."""
+    counts = queryset.order_by().values(group_field).annotate(c=Count('pk')).values('c')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
 class UserDetailView(LoginRequiredMixin, DetailView):
     """
     Профиль пользователя (свой или других).
@@ -104,16 +129,27 @@ class UserDetailView(LoginRequiredMixin, DetailView):
     template_name = 'communications/user_detail.html'
     context_object_name = 'user_obj'
     
+    def get_queryset(self):
+        """
+        Счётчики статистики — скалярными подзапросами в том же SELECT,
+        что и профиль (без JOIN'ов, которые перемножали бы строки).
+        """
+        return User.objects.annotate(
+            sent_messages_count=_count_subquery(Message.objects.filter(sender=OuterRef('pk')), 'sender'),
+            received_messages_count=_count_subquery(Message.objects.filter(recipient=OuterRef('pk')), 'recipient'),
+            created_reports_count=_count_subquery(Report.objects.filter(employee=OuterRef('pk')), 'employee'),
+        )
+    
     def get_context_data(self, **kwargs):
         """Добавляет дополнительную информацию"""
         context = super().get_context_data(**kwargs)
         user = self.object
         
         if user.role == 'employee':
-            context['sent_messages'] = Message.objects.filter(sender=user).count()
-            context['created_reports'] = Report.objects.filter(employee=user).count()
+            context['sent_messages'] = user.sent_messages_count
+            context['created_reports'] = user.created_reports_count
         elif user.role == 'parent':
-            context['received_messages'] = Message.objects.filter(recipient=user).count()
+            context['received_messages'] = user.received_messages_count
         
         return context
 
@@ -195,38 +231,49 @@ class MessageListView(LoginRequiredMixin, ListView):
     context_object_name = 'messages'
     paginate_by = 20
     
+    @cached_property
+    def _inbox_qs(self):
+        """Входящие текущего пользователя"""
+        return Message.objects.filter(recipient=self.request.user)
+    
     def get_queryset(self):
         """Получает входящие сообщения для текущего пользователя"""
-        queryset = Message.objects.filter(
-            recipient=self.request.user
-        ).select_related('sender').order_by('-created_at')
+        # Текст и вложение в списке не выводятся — не тянем их из БД (TOAST)
+        queryset = self._inbox_qs.select_related('sender').defer(*LIST_DEFERRED_FIELDS).order_by('-created_at')
+        params = self.request.GET
         
         # Фильтр по статусу чтения
-        filter_type = self.request.GET.get('filter_type', 'all').strip()
+        self._filter_type = filter_type = params.get('filter_type', 'all').strip()
         if filter_type == 'unread':
             queryset = queryset.filter(is_read=False)
         elif filter_type == 'read':
             queryset = queryset.filter(is_read=True)
         
         # Поиск по теме и содержимому
-        search = self.request.GET.get('search', '').strip()
+        self._search = search = params.get('search', '').strip()
         if search:
-            queryset = queryset.filter(
-                Q(subject__icontains=search) |
-                Q(content__icontains=search)
-            )
+            if connection.vendor == 'postgresql':
+                # Полнотекстовый поиск по GIN-индексу msg_search_vector
+                queryset = queryset.alias(search_vector=MESSAGE_SEARCH_VECTOR).filter(
+                    search_vector=SearchQuery(search, config=MESSAGE_SEARCH_CONFIG, search_type='websearch')
+                )
+            else:
+                # Локальная разработка на SQLite
+                queryset = queryset.filter(
+                    Q(subject__icontains=search) |
+                    Q(content__icontains=search)
+                )
         
         return queryset
     
     def get_context_data(self, **kwargs):
         """Добавляет параметры фильтра"""
         context = super().get_context_data(**kwargs)
-        context['search'] = self.request.GET.get('search', '')
-        context['filter_type'] = self.request.GET.get('filter_type', 'all')
-        context['unread_count'] = Message.objects.filter(
-            recipient=self.request.user,
-            is_read=False
-        ).count()
+        # Значения уже разобраны в get_queryset()
+        context['search'] = self._search
+        context['filter_type'] = self._filter_type
+        # Счётчик кэшируется между запросами; сбрасывается сигналом при изменении сообщений
+        context['unread_count'] = get_unread_count(self.request.user.id)
         return context
 
 
@@ -245,10 +292,19 @@ class MessageDetailView(LoginRequiredMixin, DetailView):
         response = super().get(request, *args, **kwargs)
         
         message = self.object
-        if message.recipient == request.user and not message.is_read:
+        if message.recipient_id == request.user.id and not message.is_read:
+            # Точечный UPDATE двух полей вместо save() всей строки
+            read_at = timezone.now()
+            marked = Message.objects.filter(
+                pk=message.pk, recipient=request.user, is_read=False
+            ).update(is_read=True, read_at=read_at)
+            # Шаблон рендерится после get() — отражаем изменение и в объекте
             message.is_read = True
-            message.read_at = timezone.now()
-            message.save()
+            message.read_at = read_at
+            if marked:
+                # update() не отправляет post_save — сбрасываем кэши счётчиков вручную
+                cache.delete(unread_count_cache_key(request.user.id))
+                invalidate_user_dashboards(request.user.id)
         
         return response
 
@@ -310,20 +366,22 @@ class ReportListView(LoginRequiredMixin, ListView):
         """Получает отчеты созданные текущим пользователем"""
         queryset = Report.objects.filter(
             employee=self.request.user
-        ).order_by('-created_at')
+        ).select_related('employee').defer(*LIST_DEFERRED_FIELDS).order_by('-created_at')
+        params = self.request.GET
         
         # Фильтр по типам отчетов
-        report_types = self.request.GET.getlist('report_type')
+        # (пересечение с допустимыми значениями: без дублей, не длиннее списка choices)
+        report_types = _VALID_REPORT_TYPES.intersection(params.getlist('report_type'))
         if report_types:
             queryset = queryset.filter(report_type__in=report_types)
         
         # Фильтр по статусам
-        statuses = self.request.GET.getlist('status')
+        statuses = _VALID_REPORT_STATUSES.intersection(params.getlist('status'))
         if statuses:
             queryset = queryset.filter(status__in=statuses)
         
         # Поиск по названию
-        search = self.request.GET.get('search', '').strip()
+        self._search = search = params.get('search', '').strip()
         if search:
             queryset = queryset.filter(
                 Q(title__icontains=search) |
@@ -335,7 +393,7 @@ class ReportListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         """Добавляет параметры фильтра"""
         context = super().get_context_data(**kwargs)
-        context['search'] = self.request.GET.get('search', '')
+        context['search'] = self._search  # разобран в get_queryset()
         context['report_types'] = Report.REPORT_TYPE_CHOICES
         context['statuses'] = Report.STATUS_CHOICES
         return context
@@ -405,24 +463,21 @@ class ReportUpdateView(LoginRequiredMixin, UpdateView):
         return context
 
 
-class ReportDeleteView(LoginRequiredMixin, DeleteView):
+class ReportDeleteView(LoginRequiredMixin, SuccessMessageMixin, DeleteView):
     """
     Удаление отчета (только автор или администратор).
+    
+    С Django 4.0 POST обрабатывается через form_valid(), а переопределение
+    delete() не вызывается — сообщение выводит SuccessMessageMixin.
     """
     model = Report
     template_name = 'communications/report_confirm_delete.html'
     success_url = reverse_lazy('communications:report-list')
+    success_message = 'Отчет "%(title)s" удален!'
     
-    def delete(self, request, *args, **kwargs):
-        """Удаляет отчет с сообщением"""
-        self.object = self.get_object()
-        report_title = self.object.title
-        response = super().delete(request, *args, **kwargs)
-        messages.success(
-            request,
-            f'Отчет "{report_title}" удален!'
-        )
-        return response
+    def get_success_message(self, cleaned_data):
+        """Форма удаления пустая — название берём из уже загруженного объекта"""
+        return self.success_message % {'title': self.object.title}
     
     def get_context_data(self, **kwargs):
         """Добавляет информацию в контекст удаления"""
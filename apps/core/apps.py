@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.core'
+
+    def ready(self):
+        # Регистрация обработчиков сигналов (сброс кэша дашборда)
+        from . import signals  # noqa: F401
@@ -0,0 +1,45 @@
+"""
+Декораторы представлений приложения core.
+"""
+
+from functools import wraps
+
+from django.contrib.messages import get_messages
+from django.utils.cache import patch_cache_control
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
+
+def _patch_private(response):
+    patch_cache_control(response, private=True)
+
+
+def versioned_cache_page(timeout, key_prefix, get_version):
+    """
+    cache_page + vary_on_cookie с версией в префиксе ключа.
+
+    Страница кэшируется отдельно для каждой сессии (права пользователя и
+    CSRF-токен в разметке не смешиваются). Инвалидация — сменой версии,
+    которую возвращает get_version(): старые записи просто перестают читаться
+    и истекают по timeout. Запросы с непоказанными сообщениями (messages)
+    не кэшируются — иначе сообщение попало бы в сохранённую копию.
+    """
+    def decorator(view_func):
+        per_session_view = vary_on_cookie(view_func)
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if get_messages(request):
+                return view_func(request, *args, **kwargs)
+            cached_view = cache_page(timeout, key_prefix=f'{key_prefix}:{get_version()}')(per_session_view)
+            response = cached_view(request, *args, **kwargs)
+            # private ставится после cache_page: ответы с private он не сохраняет.
+            # Для TemplateResponse cache_page работает в post-render callback,
+            # поэтому и заголовок — в callback, добавленном следом
+            if callable(getattr(response, 'render', None)) and not response.is_rendered:
+                response.add_post_render_callback(_patch_private)
+            else:
+                _patch_private(response)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,33 @@
+"""
+Промежуточные слои (middleware) приложения core.
+"""
+
+from django.utils.cache import patch_cache_control
+
+# Ключ в kwargs маршрута path(): время private-кэширования ответа в секундах
+ROUTE_CACHE_SECONDS_KWARG = '_cache_s'
+
+
+class RouteCacheControlMiddleware:
+    """
+    Cache-Control: private, max-age=N для маршрутов с kwargs={'_cache_s': N}.
+
+    Ключ извлекается из аргументов до вызова представления, так что сами
+    представления о нём не знают. Заголовок ставится только на успешный ответ
+    и только если представление не задало Cache-Control само.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        max_age = getattr(request, '_route_cache_seconds', None)
+        if max_age and response.status_code == 200 and not response.has_header('Cache-Control'):
+            patch_cache_control(response, private=True, max_age=max_age)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # view_kwargs — тот же словарь, с которым будет вызвано представление
+        request._route_cache_seconds = view_kwargs.pop(ROUTE_CACHE_SECONDS_KWARG, None)
+        return None
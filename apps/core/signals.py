@@ -0,0 +1,86 @@
+"""
+Сигналы приложения core.
+
+Сбрасывают закэшированные данные дашборда при изменении сообщений и студентов,
+а также кэш связи «пользователь → профиль сотрудника/родителя».
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.communications.models import Message
+from apps.employees.models import Employee
+from apps.parents.models import Parent
+from apps.students.models import Student
+
+
+def dashboard_cache_key(role, user_id=None):
+    """Ключ кэша контекста дашборда (у администраторов он общий)."""
+    if user_id is None:
+        return f'dash:{role}'
+    return f'dash:{role}:{user_id}'
+
+
+def profile_ids_cache_key(user_id):
+    """Ключ кэша пары (employee_id, parent_id) пользователя."""
+    return f'profile_ids:{user_id}'
+
+
+def invalidate_user_dashboards(*user_ids):
+    keys = [dashboard_cache_key('admin')]
+    for user_id in user_ids:
+        if user_id:
+            keys += [dashboard_cache_key('employee', user_id), dashboard_cache_key('parent', user_id)]
+    cache.delete_many(keys)
+
+
+@receiver([post_save, post_delete], sender=Message)
+def invalidate_dashboard_on_message(sender, instance, **kwargs):
+    """Новое/прочитанное сообщение меняет счётчики отправителя и получателя."""
+    invalidate_user_dashboards(instance.sender_id, instance.recipient_id)
+
+
+@receiver(pre_save, sender=Student)
+def remember_previous_student_links(sender, instance, raw=False, **kwargs):
+    """Запоминает прежних куратора и родителя: при смене нужно сбросить и их дашборды."""
+    previous = None
+    if not raw and instance.pk is not None:
+        previous = sender.objects.filter(pk=instance.pk).values_list('advisor_id', 'parent_id').first()
+    instance._previous_links = previous or (None, None)
+
+
+@receiver([post_save, post_delete], sender=Student)
+def invalidate_dashboard_on_student(sender, instance, **kwargs):
+    """Изменение студента меняет дашборды куратора и родителя — нынешних и прежних."""
+    previous_advisor_id, previous_parent_id = getattr(instance, '_previous_links', (None, None))
+    advisor_ids = {instance.advisor_id, previous_advisor_id} - {None}
+    parent_ids = {instance.parent_id, previous_parent_id} - {None}
+    user_ids = []
+    if advisor_ids:
+        user_ids += Employee.objects.filter(pk__in=advisor_ids).values_list('user_id', flat=True)
+    if parent_ids:
+        user_ids += Parent.objects.filter(pk__in=parent_ids).values_list('user_id', flat=True)
+    invalidate_user_dashboards(*user_ids)
+
+
+@receiver(pre_save, sender=Employee)
+@receiver(pre_save, sender=Parent)
+def remember_previous_profile_user(sender, instance, raw=False, **kwargs):
+    """Запоминает прежнего пользователя профиля: при перепривязке сбрасываем кэш обоих."""
+    if raw or instance.pk is None:
+        instance._previous_user_id = None
+        return
+    instance._previous_user_id = sender.objects.filter(pk=instance.pk).values_list(
+        'user_id', flat=True
+    ).first()
+
+
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Parent)
+def invalidate_profile_ids(sender, instance, **kwargs):
+    """Профиль создан/удалён/перепривязан — сбрасываем кэш связи с пользователем (новым и прежним)."""
+    user_ids = {instance.user_id, getattr(instance, '_previous_user_id', None)} - {None}
+    if user_ids:
+        cache.delete_many([profile_ids_cache_key(user_id) for user_id in user_ids])
+        invalidate_user_dashboards(*user_ids)
@@ -28,9 +28,17 @@
 - methods: Поддерживаемые HTTP методы
 """
 
-from django.urls import path
+from django.urls import include, path
 
-from . import views
+from .views import (
+    api_messages,
+    api_send_message,
+    dashboard,
+    index,
+    login_view,
+    logout_view,
+    messages_view,
+)
 
 
 # ==============================================================================
@@ -51,7 +59,7 @@ urlpatterns = [
     # DESCRIPTION: Главная страница приложения
     # METHODS: GET
     # RESPONSE: редирект на /dashboard/ (если авторизован) или /login/ (если нет)
-    path("", views.index, name="index"),
+    path("", index, name="index"),
 
     # АУТЕНТИФИКАЦИЯ
     # --------
@@ -60,14 +68,14 @@ urlpatterns = [
     # METHODS: GET, POST
     # GET RESPONSE: Рендер шаблона auth/login.html
     # POST RESPONSE: редирект на /dashboard/ (если ок, или обратно в login.html с ошибкой)
-    path("login/", views.login_view, name="login"),
+    path("login/", login_view, name="login"),
 
     # ENDPOINT: GET /logout/
     # DESCRIPTION: Выход из системы и разрушение сессии
     # METHODS: GET
     # RESPONSE: редирект на /login/
     # REQUIRES: Должен быть авторизован (если нет - редирект на /login/)
-    path("logout/", views.logout_view, name="logout"),
+    path("logout/", logout_view, name="logout"),
 
     # ДАШБОРД
     # --------
@@ -79,7 +87,7 @@ urlpatterns = [
     #   - Роль = 'staff' → рендер dashboard/staff.html (дашборд сотрудника)
     #   - Роль = 'parent' → рендер dashboard/parent.html (дашборд родителя)
     # REQUIRES: Должен быть авторизован (если нет - редирект на /login/)
-    path("dashboard/", views.dashboard, name="dashboard"),
+    path("dashboard/", dashboard, name="dashboard"),
 
     # МОДУЛЬ СООБЩЕНИЙ
     # --------
@@ -88,27 +96,31 @@ urlpatterns = [
     # METHODS: GET
     # RESPONSE: рендер messages/messages.html с контактами
     # REQUIRES: Должен быть авторизован
-    path("messages/", views.messages_view, name="messages"),
+    path("messages/", messages_view, name="messages"),
 
     # API ENDPOINTS
     # --------
-    # ENDPOINT: GET /api/messages/
-    # DESCRIPTION: JSON API для получения сообщений между конкретным пользователем
-    # METHODS: GET
-    # QUERY PARAMS: contact_id (int) - ID контакта
-    # RESPONSE: JSON со списком сообщений или ошибка
-    # EXAMPLE: curl "http://localhost:8000/api/messages/?contact_id=5"
-    # REQUIRES: Должен быть авторизован
-    path("api/messages/", views.api_messages, name="api_messages"),
-
-    # ENDPOINT: POST /api/messages/send/
-    # DESCRIPTION: JSON API для отправки нового сообщения
-    # METHODS: POST
-    # REQUEST BODY (JSON): {"recipient_id": <int>, "content": "<string>"}
-    # RESPONSE: JSON с инфо о созданном сообщении
-    # EXAMPLE: curl -X POST http://localhost:8000/api/messages/send/ \
-    #               -H "Content-Type: application/json" \
-    #               -d '{"recipient_id": 5, "content": "Hello!"}'
-    # REQUIRES: Должен быть авторизован
-    path("api/messages/send/", views.api_send_message, name="api_send_message"),
+    # Сгруппированы под общим префиксом api/messages/: резолвер проверяет префикс
+    # один раз и не перебирает вложенные маршруты для остальных запросов.
+    path("api/messages/", include([
+        # ENDPOINT: GET /api/messages/
+        # DESCRIPTION: JSON API для получения сообщений между конкретным пользователем
+        # METHODS: GET
+        # QUERY PARAMS: contact_id (int) - ID контакта
+        # RESPONSE: JSON со списком сообщений или ошибка
+        # EXAMPLE: curl "http://localhost:8000/api/messages/?contact_id=5"
+        # REQUIRES: Должен быть авторизован
+        path("", api_messages, name="api_messages"),
+
+        # ENDPOINT: POST /api/messages/send/
+        # DESCRIPTION: JSON API для отправки нового сообщения
+        # METHODS: POST
+        # REQUEST BODY (JSON): {"recipient_id": <int>, "content": "<string>"}
+        # RESPONSE: JSON с инфо о созданном сообщении
+        # EXAMPLE: curl -X POST http://localhost:8000/api/messages/send/ \
+        #               -H "Content-Type: application/json" \
+        #               -d '{"recipient_id": 5, "content": "Hello!"}'
+        # REQUIRES: Должен быть авторизован
+        path("send/", api_send_message, name="api_send_message"),
+    ])),
 ]
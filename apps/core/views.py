@@ -1,5 +1,5 @@
 """================================================================================
-МОДУЛЬ: college_portal.views
+МОДУЛЬ: apps.core.views
 ОПИСАНИЕ: Представления (views) для главного приложения колледжа
 КОМПЕТЕНЦИИ: ПК-1, ПК-7, ПК-9, ПК-11
 ================================================================================
@@ -21,28 +21,46 @@
 # РАЗДЕЛ 1: ИМПОРТЫ
 # ==============================================================================
 
-from django.shortcuts import render, redirect
+from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
-from django.views.decorators.http import require_http_methods
-from django.db.models import Q
-from django.utils.timezone import now
-import json
+from django.http import HttpResponse, HttpResponseRedirect
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition, require_http_methods
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Func, IntegerField, Max, Q, Subquery
+from django.db.models.functions import Coalesce
+from datetime import datetime, time, timedelta
+from functools import lru_cache
+
+import orjson
 
 from apps.communications.models import User, Message, Report
 from apps.students.models import Student
-from apps.employees.models import Employee
-from apps.parents.models import Parent
 from django.contrib.sessions.models import Session
 from django.utils import timezone
+from apps.communications.signals import (
+    get_unread_count, invalidate_unread_counts, unread_count_cache_key,
+)
 from apps.public.models import Feedback
 
+from .signals import dashboard_cache_key, invalidate_user_dashboards, profile_ids_cache_key
+
 
 # ==============================================================================
 # РАЗДЕЛ 2: ГЛАВНАЯ СТРАНИЦА
 # ==============================================================================
 
+@lru_cache(maxsize=None)
+def _url(name):
+    """reverse() для маршрутов без параметров — вычисляется один раз на процесс."""
+    return reverse(name)
+
+
 def index(request):
     """
     ENDPOINT: GET /
@@ -59,8 +77,8 @@ def index(request):
       HttpResponseRedirect: Редирект на dashboard или login
     """
     if request.user.is_authenticated:
-        return redirect('core:dashboard')
-    return redirect('core:login')
+        return HttpResponseRedirect(_url('core:dashboard'))
+    return HttpResponseRedirect(_url('core:login'))
 
 
 # ==============================================================================
@@ -102,7 +120,7 @@ def login_view(request):
     if request.method == 'GET':
         # Если уже авторизован, перенаправляем на дашборд
         if request.user.is_authenticated:
-            return redirect('core:dashboard')
+            return HttpResponseRedirect(_url('core:dashboard'))
         # Показываем форму входа
         return render(request, 'auth/login.html')
     
@@ -110,7 +128,8 @@ def login_view(request):
     if request.method == 'POST':
         # Получаем данные из формы
         username = request.POST.get('username', '').strip()
-        password = request.POST.get('password', '').strip()
+        # Пароль не обрезаем: пробелы по краям — часть пароля
+        password = request.POST.get('password', '')
         
         # Проверяем, что оба поля заполнены
         if not username or not password:
@@ -124,7 +143,7 @@ def login_view(request):
         if user is not None:
             # Успешная аутентификация - создаём сессию
             login(request, user)
-            return redirect('core:dashboard')
+            return HttpResponseRedirect(_url('core:dashboard'))
         else:
             # Неверный логин или пароль
             return render(request, 'auth/login.html', {
@@ -150,14 +169,136 @@ def logout_view(request):
       HttpResponseRedirect: Редирект на /login/
     """
     logout(request)
-    return redirect('core:login')
+    return HttpResponseRedirect(_url('core:login'))
 
 
 # ==============================================================================
 # РАЗДЕЛ 4: ДАШБОРДЫ ДЛЯ РАЗНЫХ РОЛЕЙ
 # ==============================================================================
 
+DASHBOARD_CACHE_TIMEOUT = 30  # секунд; сбрасывается сигналами apps.core.signals
+DASHBOARD_BROWSER_MAX_AGE = 10  # секунд
+PROFILE_IDS_CACHE_TIMEOUT = 60  # секунд
+
+DASHBOARD_BREADCRUMBS = [
+    {'title': 'Главная', 'url': '/', 'icon': 'fas fa-home'},
+    {'title': 'Панель управления', 'url': None, 'icon': 'fas fa-tachometer-alt'},
+]
+
+
+def _count_subquery(queryset):
+    """
+    COUNT(*) по queryset как скалярный подзапрос для aggregate() по другой модели.
+
+    aggregate() принимает только агрегаты, поэтому подзапрос обёрнут в Max():
+    значение одно и то же для всех строк, PostgreSQL вычисляет его один раз.
+    """
+    return Coalesce(
+        Max(Subquery(queryset.order_by().annotate(_n=Func('pk', function='COUNT', output_field=IntegerField())).values('_n'))),
+        0,
+    )
+
+
+def _admin_dashboard_context():
+    """Общая статистика администратора (одинакова для всех администраторов)."""
+    # Все счётчики — одним запросом: условная агрегация по пользователям
+    # и скалярные подзапросы по остальным таблицам
+    stats = User.objects.aggregate(
+        users_count=Count('id'),
+        active_users=Count('id', filter=Q(last_login__isnull=False)),
+        messages_count=_count_subquery(Message.objects.all()),
+        reports_count=_count_subquery(Report.objects.all()),
+        active_sessions=_count_subquery(Session.objects.filter(expire_date__gte=timezone.now())),
+        pending_feedback=_count_subquery(Feedback.objects.filter(status=Feedback.STATUS_NEW)),
+    )
+    return {
+        **stats,
+        'users': list(
+            User.objects
+            .only('id', 'username', 'first_name', 'last_name', 'email', 'role', 'is_active')[:50]
+        ),
+    }
+
+
+# Поля сообщений, которые выводятся в блоке «Последние сообщения»
+RECENT_MESSAGE_FIELDS = (
+    'id', 'content', 'is_read', 'created_at',
+    'sender__id', 'sender__username', 'sender__first_name', 'sender__last_name',
+)
+
+
+def _user_profile_ids(user):
+    """
+    ID профилей сотрудника и родителя, связанных с пользователем.
+
+    Оба профиля подтягиваются одним запросом (LEFT JOIN по обратным связям)
+    и кэшируются; сброс — сигналами при изменении Employee/Parent.
+    """
+    def load():
+        row = (
+            User.objects
+            .filter(pk=user.pk)
+            .values_list('employee_profile__id', 'parent_profile__id')
+            .first()
+        )
+        return row or (None, None)
+
+    return cache.get_or_set(profile_ids_cache_key(user.id), load, PROFILE_IDS_CACHE_TIMEOUT)
+
+
+def _employee_dashboard_context(user):
+    employee_id, _ = _user_profile_ids(user)
+    # Полуинтервал [начало дня; начало следующего) вместо created_at__date:
+    # без DATE() над столбцом индекс (sender, -created_at) используется напрямую
+    day_start = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+
+    return {
+        'unread_messages': get_unread_count(user.id),
+        'assigned_students': Student.objects.filter(advisor_id=employee_id).count() if employee_id else 0,
+        'pending_reports': Message.objects.filter(
+            sender=user, created_at__gte=day_start, created_at__lt=day_start + timedelta(days=1),
+        ).count(),
+        'recent_messages': list(
+            Message.objects
+            .filter(Q(sender=user) | Q(recipient=user))
+            .select_related('sender')
+            .only(*RECENT_MESSAGE_FIELDS)
+            .order_by('-created_at')[:5]
+        ),
+    }
+
+
+def _parent_dashboard_context(user):
+    _, parent_id = _user_profile_ids(user)
+
+    student = None
+    if parent_id:
+        student = (
+            Student.objects
+            .filter(parent_id=parent_id)
+            .only('full_name', 'group', 'specialty', 'student_id', 'gpa')
+            .first()
+        )
+
+    return {
+        'student_name': student.full_name if student else 'Не привязан',
+        'student_group': student.group if student else '-',
+        'student_specialty': student.specialty if student else '-',
+        'student_id': student.student_id if student else '-',
+        'gpa': student.gpa if student else '-',
+        'unread_messages': get_unread_count(user.id),
+        'recent_messages': list(
+            Message.objects
+            .filter(recipient=user)
+            .select_related('sender')
+            .only(*RECENT_MESSAGE_FIELDS)
+            .order_by('-created_at')[:5]
+        ),
+    }
+
+
 @login_required(login_url='core:login')
+@cache_control(private=True, max_age=DASHBOARD_BROWSER_MAX_AGE)
 def dashboard(request):
     user = request.user
     role = getattr(user, 'role', 'guest')
@@ -165,79 +306,35 @@ def dashboard(request):
 
     # ⭐ ДАШБОРД АДМИНИСТРАТОРА
     if role == 'admin':
-        context.update({
-            'users_count': User.objects.count(),
-            'messages_count': Message.objects.count(),
-            'reports_count': Report.objects.count(),
-            'active_sessions': Session.objects.filter(expire_date__gte=timezone.now()).count(),
-            'pending_feedback': Feedback.objects.filter(status=Feedback.STATUS_NEW).count(),
-            'users': User.objects.all()[:50],
-        })
-        context['breadcrumbs'] = [
-            {'title': 'Главная', 'url': '/', 'icon': 'fas fa-home'},
-            {'title': 'Панель управления', 'url': None, 'icon': 'fas fa-tachometer-alt'},
-        ]
-        return render(request, 'dashboard/admin.html', context)
+        context.update(cache.get_or_set(
+            dashboard_cache_key('admin'), _admin_dashboard_context, DASHBOARD_CACHE_TIMEOUT,
+        ))
+        template = 'dashboard/admin.html'
 
     # ⭐ ДАШБОРД СОТРУДНИКА
     elif role == 'employee':
-        try:
-            employee = Employee.objects.get(user=user)
-        except Employee.DoesNotExist:
-            employee = None
-
-        context.update({
-            'employee': employee,
-            'unread_messages': Message.objects.filter(recipient=user, is_read=False).count(),
-            'assigned_students': Student.objects.filter(advisor=employee).count() if employee else 0,
-            'pending_reports': Message.objects.filter(sender=user, created_at__date=now().date()).count(),
-            'recent_messages': Message.objects.filter(
-                Q(sender=user) | Q(recipient=user)
-            ).order_by('-created_at')[:5],
-        })
-        context['breadcrumbs'] = [
-            {'title': 'Главная', 'url': '/', 'icon': 'fas fa-home'},
-            {'title': 'Панель управления', 'url': None, 'icon': 'fas fa-tachometer-alt'},
-        ]
-        return render(request, 'dashboard/staff.html', context)
+        context.update(cache.get_or_set(
+            dashboard_cache_key('employee', user.id),
+            lambda: _employee_dashboard_context(user),
+            DASHBOARD_CACHE_TIMEOUT,
+        ))
+        template = 'dashboard/staff.html'
 
     # ⭐ ДАШБОРД РОДИТЕЛЯ
     elif role == 'parent':
-        try:
-            parent = Parent.objects.get(user=user)
-        except Parent.DoesNotExist:
-            parent = None
-
-        student = None
-        if parent:
-            try:
-                student = Student.objects.get(parent=parent)
-            except Student.DoesNotExist:
-                student = None
-
-        context.update({
-            'parent': parent,
-            'student_name': student.full_name if student else 'Не привязан',
-            'student_group': student.group if student else '-',
-            'student_specialty': student.specialty if student else '-',
-            'student_id': student.student_id if student else '-',
-            'gpa': student.gpa if student else '-',
-            'unread_messages': Message.objects.filter(recipient=user, is_read=False).count(),
-            'recent_messages': Message.objects.filter(recipient=user).order_by('-created_at')[:5],
-        })
-        context['breadcrumbs'] = [
-            {'title': 'Главная', 'url': '/', 'icon': 'fas fa-home'},
-            {'title': 'Панель управления', 'url': None, 'icon': 'fas fa-tachometer-alt'},
-        ]
-        return render(request, 'dashboard/parent.html', context)
+        context.update(cache.get_or_set(
+            dashboard_cache_key('parent', user.id),
+            lambda: _parent_dashboard_context(user),
+            DASHBOARD_CACHE_TIMEOUT,
+        ))
+        template = 'dashboard/parent.html'
 
     # ⭐ ГОСТЬ — fallback
     else:
-        context['breadcrumbs'] = [
-            {'title': 'Главная', 'url': '/', 'icon': 'fas fa-home'},
-            {'title': 'Панель управления', 'url': None, 'icon': 'fas fa-tachometer-alt'},
-        ]
-        return render(request, 'dashboard/parent.html', context)
+        template = 'dashboard/parent.html'
+
+    context['breadcrumbs'] = DASHBOARD_BREADCRUMBS
+    return render(request, template, context)
 
 
 
@@ -245,6 +342,23 @@ def dashboard(request):
 # РАЗДЕЛ 5: МОДУЛЬ СООБЩЕНИЙ
 # ==============================================================================
 
+# Поля переписки для JSON API (словари через values(), без экземпляров модели)
+API_MESSAGE_FIELDS = (
+    'id', 'sender_id', 'sender__first_name', 'sender__last_name', 'sender__username',
+    'content', 'created_at', 'is_read',
+)
+
+
+# Пакетная отправка: предел сообщений в запросе и размер пачки INSERT
+SEND_BATCH_MAX = 1000
+SEND_BATCH_SIZE = 500
+
+
+def _json_response(payload, status=200):
+    """JSON-ответ API: orjson сериализует компактно и сразу в UTF-8 байты."""
+    return HttpResponse(orjson.dumps(payload), content_type='application/json', status=status)
+
+
 @login_required(login_url='core:login')
 def messages_view(request):
     """
@@ -267,32 +381,33 @@ def messages_view(request):
     """
     
     user = request.user
-    contact_ids = set()
-    
-    # Получаем ID всех, кто отправлял сообщения этому пользователю
-    sent_to_me = Message.objects.filter(recipient=user).values_list('sender_id', flat=True)
-    contact_ids.update(sent_to_me)
     
-    # Получаем ID всех, кому этот пользователь отправлял сообщения
-    sent_by_me = Message.objects.filter(sender=user).values_list('recipient_id', flat=True)
-    contact_ids.update(sent_by_me)
+    # ID собеседников — UNION по обоим направлениям переписки; дедупликация
+    # на стороне БД, подзапрос встраивается в выборку пользователей ниже
+    contact_ids = (
+        Message.objects.filter(recipient=user).values_list('sender_id', flat=True).order_by()
+        .union(Message.objects.filter(sender=user).values_list('recipient_id', flat=True).order_by())
+    )
+    
+    # Непрочитанные по отправителям — один GROUP BY вместо запроса на контакт
+    unread_map = dict(
+        Message.objects
+        .filter(recipient=user, is_read=False)
+        .values_list('sender_id')
+        .annotate(Count('id'))
+        .order_by()
+    )
     
     # Получаем объекты User для этих контактов
-    contacts = User.objects.filter(id__in=contact_ids)
+    contacts = User.objects.filter(id__in=contact_ids).only('id', 'username', 'first_name', 'last_name')
     
     # Подготавливаем данные контактов
     contacts_data = []
     for contact in contacts:
-        unread_count = Message.objects.filter(
-            sender=contact,
-            recipient=user,
-            is_read=False
-        ).count()
-        
         contacts_data.append({
             'id': contact.id,
             'name': contact.get_full_name() or contact.username,
-            'unread_count': unread_count,
+            'unread_count': unread_map.get(contact.id, 0),
         })
     
     # Доступные контакты для старта диалога (даже если переписки ещё нет)
@@ -325,7 +440,35 @@ def messages_view(request):
     return render(request, 'messages/messages.html', context)
 
 
+def _api_messages_etag(request):
+    """
+    ETag переписки: последнее сообщение, их число и число непрочитанных.
+
+    Любое новое сообщение или отметка о прочтении меняют тег, поэтому
+    опрос без изменений получает 304 без выборки и UPDATE.
+    """
+    contact_id_raw = request.GET.get('contact_id') or request.GET.get('contactid')
+    try:
+        contact_id = int(contact_id_raw)
+    except (TypeError, ValueError):
+        return None  # ошибку параметра вернёт само представление
+
+    user_id = request.user.id
+    stats = Message.objects.filter(
+        Q(sender_id=user_id, recipient_id=contact_id) | Q(sender_id=contact_id, recipient_id=user_id)
+    ).aggregate(
+        last=Max('created_at'),
+        total=Count('id'),
+        unread=Count('id', filter=Q(is_read=False)),
+    )
+    last = stats['last'].timestamp() if stats['last'] else 0
+    return f'W/"msg-{user_id}-{contact_id}-{last}-{stats["total"]}-{stats["unread"]}"'
+
+
 @login_required(login_url='core:login')
+@gzip_page
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_api_messages_etag)
 def api_messages(request):
     """
     ENDPOINT: GET /api/messages/
@@ -364,43 +507,62 @@ def api_messages(request):
     
     contact_id_raw = request.GET.get('contact_id') or request.GET.get('contactid')
     if not contact_id_raw:
-        return JsonResponse({'error': 'contact_id обязателен'}, status=400)
+        return _json_response({'error': 'contact_id обязателен'}, status=400)
 
     try:
         contact_id = int(contact_id_raw)
     except (TypeError, ValueError):
-        return JsonResponse({'error': 'contact_id должен быть числом'}, status=400)
+        return _json_response({'error': 'contact_id должен быть числом'}, status=400)
 
     user = request.user  # <-- важно: объявляем ДО любого использования
 
     try:
         contact = User.objects.get(id=contact_id)
     except User.DoesNotExist:
-        return JsonResponse({'error': 'Контакт не найден'}, status=404)
+        return _json_response({'error': 'Контакт не найден'}, status=404)
   
     # Получаем все сообщения между пользователями
-    messages = Message.objects.filter(
-        Q(sender=user, recipient=contact) | Q(sender=contact, recipient=user)
-    ).order_by('created_at')
-    
-    # Отмечаем сообщения от контакта как прочитанные
-    Message.objects.filter(
-        sender=contact,
-        recipient=user,
-        is_read=False
-    ).update(is_read=True)
+    # (values() — словари вместо экземпляров модели; отправитель подтягивается JOIN'ом)
+    messages = (
+        Message.objects
+        .filter(Q(sender=user, recipient=contact) | Q(sender=contact, recipient=user))
+        .order_by('created_at')
+        .values(*API_MESSAGE_FIELDS)
+    )
+    
+    with transaction.atomic():
+        messages = list(messages)
+
+        # Отмечаем сообщения от контакта как прочитанные. Непрочитанные уже есть
+        # в выборке, поэтому UPDATE выполняется только когда они действительно есть.
+        unread = [msg for msg in messages if msg['sender_id'] == contact.id and not msg['is_read']]
+        if unread:
+            Message.objects.filter(
+                id__in=[msg['id'] for msg in unread],
+                is_read=False,
+            ).update(is_read=True)
+            for msg in unread:
+                msg['is_read'] = True
+
+    if unread:
+        # update() не отправляет post_save — сбрасываем кэши счётчиков вручную
+        invalidate_user_dashboards(user.id)
+        cache.delete(unread_count_cache_key(user.id))
     
     # Форматируем сообщения для JSON
     messages_data = [{
-        'id': msg.id,
-        'sender_id': msg.sender.id,
-        'sender_name': msg.sender.get_full_name() or msg.sender.username,
-        'content': msg.content,
-        'created_at': msg.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-        'is_read': msg.is_read,
+        'id': msg['id'],
+        'sender_id': msg['sender_id'],
+        'sender_name': (
+            f"{msg['sender__first_name']} {msg['sender__last_name']}".strip()
+            or msg['sender__username']
+        ),
+        'content': msg['content'],
+        'created_at': msg['created_at'].strftime('%Y-%m-%d %H:%M:%S'),
+        'is_read': msg['is_read'],
     } for msg in messages]
     
-    return JsonResponse({'messages': messages_data})
+    return _json_response({'messages': messages_data})
 
 
 @login_required(login_url='core:login')
@@ -444,6 +606,10 @@ def api_send_message(request):
         }
       }
     
+    ПАКЕТНАЯ ОТПРАВКА (например, сброс очереди после переподключения):
+      ЗАПРОС: {"messages": [{"recipient_id": 5, "content": "..."}, ...]}
+      ОТВЕТ:  {"success": true, "ids": [42, 43, ...]}
+
     ВОЗВРАЩАЕТ (ошибка):
       JSON 400: {"error": "recipient_id и content обязательны"}
       JSON 404: {"error": "Получатель не найден"}
@@ -452,7 +618,11 @@ def api_send_message(request):
 
     try:
         # Парсим JSON из тела запроса
-        data = json.loads(request.body)
+        data = orjson.loads(request.body)
+
+        # Пакетная отправка: {"messages": [{...}, ...]}
+        if isinstance(data, dict) and isinstance(data.get('messages'), list):
+            return _api_send_message_batch(request, data['messages'])
 
         recipient_id_raw = data.get('recipient_id') or data.get('recipientid')
         subject = (data.get('subject') or 'Чат').strip()
@@ -461,11 +631,11 @@ def api_send_message(request):
         try:
             recipient_id = int(recipient_id_raw)
         except (TypeError, ValueError):
-            return JsonResponse({'error': 'recipient_id должен быть числом'}, status=400)
+            return _json_response({'error': 'recipient_id должен быть числом'}, status=400)
             
         # Проверяем, что оба поля заполнены
         if not content:
-            return JsonResponse({'error': 'content обязателен'}, status=400)
+            return _json_response({'error': 'content обязателен'}, status=400)
         
         # Получаем получателя из БД
         recipient = User.objects.get(id=recipient_id)
@@ -479,7 +649,7 @@ def api_send_message(request):
         )
         
         # Возвращаем информацию о созданном сообщении
-        return JsonResponse({
+        return _json_response({
             'success': True,
             'message': {
                 'id': message.id,
@@ -491,17 +661,74 @@ def api_send_message(request):
         })
         
     except User.DoesNotExist:
-        return JsonResponse({'error': 'Получатель не найден'}, status=404)
-    except json.JSONDecodeError:
-        return JsonResponse({'error': 'Неверный JSON'}, status=400)
+        return _json_response({'error': 'Получатель не найден'}, status=404)
+    except orjson.JSONDecodeError:
+        return _json_response({'error': 'Неверный JSON'}, status=400)
     except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+        return _json_response({'error': str(e)}, status=500)
+
+
+def _api_send_message_batch(request, items):
+    """
+    Пакетная отправка сообщений: проверка получателей одним запросом
+    и вставка через bulk_create вместо INSERT на каждое сообщение.
+    """
+    if not items:
+        return _json_response({'error': 'messages не должен быть пустым'}, status=400)
+    if len(items) > SEND_BATCH_MAX:
+        return _json_response({'error': f'Не более {SEND_BATCH_MAX} сообщений за запрос'}, status=400)
+
+    parsed = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            return _json_response({'error': f'messages[{i}]: ожидается объект'}, status=400)
+        try:
+            recipient_id = int(item.get('recipient_id') or item.get('recipientid'))
+        except (TypeError, ValueError):
+            return _json_response({'error': f'messages[{i}]: recipient_id должен быть числом'}, status=400)
+        content = (item.get('content') or '').strip()
+        if not content:
+            return _json_response({'error': f'messages[{i}]: content обязателен'}, status=400)
+        subject = (item.get('subject') or 'Чат').strip()
+        parsed.append((recipient_id, subject, content))
+
+    recipient_ids = {recipient_id for recipient_id, _, _ in parsed}
+    existing = set(User.objects.filter(id__in=recipient_ids).values_list('id', flat=True))
+    missing = sorted(recipient_ids - existing)
+    if missing:
+        return _json_response({'error': 'Получатель не найден', 'recipient_ids': missing}, status=404)
+
+    sender = request.user
+    created = Message.objects.bulk_create(
+        [
+            Message(sender=sender, recipient_id=recipient_id, subject=subject, content=content)
+            for recipient_id, subject, content in parsed
+        ],
+        batch_size=SEND_BATCH_SIZE,
+    )
+
+    # bulk_create не отправляет post_save — сбрасываем кэш дашбордов и счётчики вручную
+    invalidate_user_dashboards(sender.id, *existing)
+    invalidate_unread_counts(existing)
+
+    return _json_response({'success': True, 'ids': [message.id for message in created]})
 
 
 # ==============================================================================
 # РАЗДЕЛ 6: ОБРАБОТЧИКИ ОШИБОК
 # ==============================================================================
 
+@lru_cache(maxsize=None)
+def _error_page_body(template_name):
+    """
+    Отрендеренная страница ошибки (рендерится один раз на процесс).
+
+    Шаблоны errors/*.html статичны — без контекста и тегов, поэтому результат
+    можно переиспользовать: поток 404 от ботов не нагружает шаблонизатор.
+    """
+    return render_to_string(template_name)
+
+
 def page_not_found(request, exception):
     """
     ОБРАБОТЧИК: 404 Not Found
@@ -513,7 +740,7 @@ def page_not_found(request, exception):
     ВОЗВРАЩАЕТ:
       HttpResponse: Рендер шаблона errors/404.html со статусом 404
     """
-    return render(request, 'errors/404.html', status=404)
+    return HttpResponse(_error_page_body('errors/404.html'), status=404)
 
 
 def server_error(request):
@@ -527,4 +754,4 @@ def server_error(request):
     ВОЗВРАЩАЕТ:
       HttpResponse: Рендер шаблона errors/500.html со статусом 500
     """
-    return render(request, 'errors/500.html', status=500)
+    return HttpResponse(_error_page_body('errors/500.html'), status=500)
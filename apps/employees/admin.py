@@ -268,9 +268,7 @@ class EmployeeAdmin(admin.ModelAdmin):
         'created_at',
     ]
     search_fields = [
-        'last_name',
-        'first_name',
-        'middle_name',
+        'full_name',
         'employee_id',
         'email',
         'phone',
@@ -0,0 +1,41 @@
+"""
+Конвертеры путей URL для модуля сотрудников.
+"""
+
+import re
+
+# Верхняя граница BigAutoField (DEFAULT_AUTO_FIELD проекта)
+PK_MAX = 2 ** 63 - 1
+
+
+class PositiveIntPKConverter:
+    """
+    Первичный ключ: положительное целое без ведущих нулей, не больше PK_MAX.
+
+    Мусорные идентификаторы (0, 007, 20-значные числа) отсекаются при
+    разрешении URL — 404 отдаётся без обращения к представлению и БД.
+    """
+
+    regex = r'[1-9][0-9]{0,18}'
+
+    def to_python(self, value):
+        pk = int(value)
+        if pk > PK_MAX:
+            # ValueError означает «маршрут не совпал»
+            raise ValueError(value)
+        return pk
+
+    def to_url(self, value):
+        return str(value)
+
+
+def parse_pk(value):
+    """
+    Первичный ключ из параметра запроса (?after=, ?department=) по тем же
+    правилам, что и PositiveIntPKConverter; None — если значение не подходит.
+    Только ASCII-цифры: str.isdigit() пропускает '²' и арабо-индийские цифры.
+    """
+    if not re.fullmatch(PositiveIntPKConverter.regex, value or ''):
+        return None
+    pk = int(value)
+    return pk if pk <= PK_MAX else None
@@ -5,18 +5,161 @@ Formы Django для ввода и фильтрации данных о сотр
 Компетенция ПК-1.2: Уметь проводить анализ потребностей пользователей информационных ресурсов предприятия.
 """
 
+import copy
+
 from django import forms
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.forms import ModelForm, ModelMultipleChoiceField, DateInput, TextInput
+from django.forms.models import ModelChoiceField, ModelChoiceIterator, ModelFormMetaclass
 from .models import Employee, Department, Position, Qualification, EmployeeSchedule
+from .signals import (
+    DEPARTMENT_CHOICES_CACHE_KEY,
+    POSITION_CHOICES_CACHE_KEY,
+    QUALIFICATION_CHOICES_CACHE_KEY,
+)
+
+# Время жизни закэшированных вариантов выбора (сбрасываются сигналами раньше)
+CHOICES_CACHE_TIMEOUT = 60 * 60
+
+# Статические варианты выбора формы фильтра (собираются один раз при импорте)
+_STATUS_FILTER_CHOICES = (('', '---'),) + tuple(Employee.STATUS_CHOICES)
+_DISMISSED = 'DISMISSED'
+_IS_CONTACT_CHOICES = (('', '---'), ('true', 'Контактные лица'), ('false', 'Остальные'))
+
+# Общие атрибуты виджетов (Widget копирует attrs в __init__, поэтому словари можно разделять)
+FC = {'class': 'form-control'}
+FC_CHK = {'class': 'form-check-input'}
+FC_DATE = dict(FC, type='date')
+FC_TIME = dict(FC, type='time')
+
+# Поля рабочего графика: начало и конец для каждого дня недели
+SCHEDULE_DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+SCHEDULE_TIME_FIELDS = tuple(
+    f'{day}_{bound}' for day in SCHEDULE_DAYS for bound in ('start', 'end')
+)
+
+
+# ===== ПОЛЯ С КЭШИРОВАННЫМИ ВАРИАНТАМИ =====
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """
+    Варианты выбора из кэша вместо SELECT при каждом рендере виджета.
+
+    В кэше хранятся пары (pk, подпись); сброс — сигналами employees.signals.
+    """
+
+    def _cached_choices(self):
+        field = self.field
+        return cache.get_or_set(
+            field.choices_cache_key,
+            lambda: [(obj.pk, field.label_from_instance(obj)) for obj in self.queryset],
+            CHOICES_CACHE_TIMEOUT,
+        )
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self._cached_choices()
+
+    def __len__(self):
+        return len(self._cached_choices()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self._cached_choices())
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """ModelChoiceField с вариантами из кэша (проверка значения — по БД)."""
+
+    iterator = CachedModelChoiceIterator
+
+    def __init__(self, queryset, *, choices_cache_key, **kwargs):
+        self.choices_cache_key = choices_cache_key
+        super().__init__(queryset, **kwargs)
 
 
-class EmployeeForm(ModelForm):
+class CachedModelMultipleChoiceField(ModelMultipleChoiceField):
+    """ModelMultipleChoiceField с вариантами из кэша (проверка значений — по БД)."""
+
+    iterator = CachedModelChoiceIterator
+
+    def __init__(self, queryset, *, choices_cache_key, **kwargs):
+        self.choices_cache_key = choices_cache_key
+        super().__init__(queryset, **kwargs)
+
+    def _check_values(self, value):
+        """
+        Проверяет отмеченные pk одним SELECT id ... WHERE id IN (...) без создания моделей.
+        Возвращает список pk — ManyRelatedManager.set() принимает их напрямую.
+        """
+        pk_field = self.queryset.model._meta.pk
+        pks = set()
+        for pk in value:
+            self.validate_no_null_characters(pk)
+            try:
+                pks.add(pk_field.to_python(pk))
+            except (TypeError, ValidationError):
+                raise ValidationError(
+                    self.error_messages['invalid_pk_value'],
+                    code='invalid_pk_value',
+                    params={'pk': pk},
+                )
+
+        valid = set(
+            self.queryset.filter(pk__in=pks).order_by().values_list('pk', flat=True)
+        )
+        for pk in pks - valid:
+            raise ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': pk},
+            )
+        return list(valid)
+
+
+# ===== ОБЛЕГЧЁННОЕ КОПИРОВАНИЕ ПОЛЕЙ ФОРМЫ =====
+
+class _ShallowCopiedFields(dict):
+    """
+    base_fields, которые BaseForm.__init__ копирует без полного deepcopy.
+
+    Повторяет Field.__deepcopy__ (свой виджет с копией attrs, error_messages,
+    validators), но не копирует вглубь списки choices: они общие и неизменяемые
+    (кортежи и константы модуля). ModelChoiceField получает новый queryset —
+    вместе с ним виджет получает собственный итератор вариантов.
+    """
+
+    def __deepcopy__(self, memo):
+        fields = {}
+        for name, field in self.items():
+            result = copy.copy(field)
+            result.widget = copy.deepcopy(field.widget, memo)
+            result.error_messages = field.error_messages.copy()
+            result.validators = field.validators[:]
+            if isinstance(field, ModelChoiceField) and field.queryset is not None:
+                result.queryset = field.queryset
+            fields[name] = result
+        return fields
+
+
+class SharedFieldsModelFormMetaclass(ModelFormMetaclass):
+    """Метакласс ModelForm: поля экземпляра формы копируются через _ShallowCopiedFields."""
+
+    def __new__(mcs, name, bases, attrs):
+        new_class = super().__new__(mcs, name, bases, attrs)
+        new_class.base_fields = _ShallowCopiedFields(new_class.base_fields)
+        return new_class
+
+
+class EmployeeForm(ModelForm, metaclass=SharedFieldsModelFormMetaclass):
     """
     Форма для создания и редактирования данных о сотрудниках.
     Включает валидацию email, телефонных номеров и проверку статуса.
     """
-    qualifications = ModelMultipleChoiceField(
-        queryset=Qualification.objects.filter(is_active=True),
+    qualifications = CachedModelMultipleChoiceField(
+        queryset=Qualification.objects.active().only('id', 'name', 'type'),
+        choices_cache_key=QUALIFICATION_CHOICES_CACHE_KEY,
         required=False,
         widget=forms.CheckboxSelectMultiple,
         label='Квалификации и сертификаты'
@@ -35,81 +178,24 @@ class EmployeeForm(ModelForm):
             'is_contact_person', 'can_send_notifications'
         ]
         widgets = {
-            'first_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Введите имя',
-                'required': True
-            }),
-            'last_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Введите фамилию',
-                'required': True
-            }),
-            'middle_name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Введите отчество (опционально)'
-            }),
-            'date_of_birth': forms.DateInput(attrs={
-                'class': 'form-control',
-                'type': 'date'
-            }),
-            'gender': forms.Select(attrs={
-                'class': 'form-control'
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'example@university.ru',
-                'required': True
-            }),
-            'phone': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': '+7 (999) 123-45-67',
-                'required': True
-            }),
-            'mobile_phone': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': '+7 (999) 123-45-67'
-            }),
-            'employee_id': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'СОТ-001',
-                'required': True
-            }),
-            'position': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'department': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'office_room': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': '305'
-            }),
-            'status': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'termination_date': forms.DateInput(attrs={
-                'class': 'form-control',
-                'type': 'date'
-            }),
-            'photo': forms.FileInput(attrs={
-                'class': 'form-control',
-                'accept': 'image/*'
-            }),
-            'biography': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Биография и достижения сотрудника'
-            }),
-            'is_contact_person': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'can_send_notifications': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
+            'first_name': forms.TextInput(attrs={**FC, 'placeholder': 'Введите имя'}),
+            'last_name': forms.TextInput(attrs={**FC, 'placeholder': 'Введите фамилию'}),
+            'middle_name': forms.TextInput(attrs={**FC, 'placeholder': 'Введите отчество (опционально)'}),
+            'date_of_birth': forms.DateInput(attrs=FC_DATE),
+            'gender': forms.Select(attrs=FC),
+            'email': forms.EmailInput(attrs={**FC, 'placeholder': 'example@university.ru'}),
+            'phone': forms.TextInput(attrs={**FC, 'placeholder': '+7 (999) 123-45-67'}),
+            'mobile_phone': forms.TextInput(attrs={**FC, 'placeholder': '+7 (999) 123-45-67'}),
+            'employee_id': forms.TextInput(attrs={**FC, 'placeholder': 'СОТ-001'}),
+            'position': forms.Select(attrs=FC),
+            'department': forms.Select(attrs=FC),
+            'office_room': forms.TextInput(attrs={**FC, 'placeholder': '305'}),
+            'status': forms.Select(attrs=FC),
+            'termination_date': forms.DateInput(attrs=FC_DATE),
+            'photo': forms.ClearableFileInput(attrs={**FC, 'accept': 'image/*'}),
+            'biography': forms.Textarea(attrs={**FC, 'rows': 4, 'placeholder': 'Биография и достижения сотрудника'}),
+            'is_contact_person': forms.CheckboxInput(attrs=FC_CHK),
+            'can_send_notifications': forms.CheckboxInput(attrs=FC_CHK),
         }
 
     def clean(self):
@@ -121,13 +207,15 @@ class EmployeeForm(ModelForm):
         status = cleaned_data.get('status')
         termination_date = cleaned_data.get('termination_date')
 
+        dismissed = status == _DISMISSED
+
         # Если сотрудник уволен, дата увольнения должна быть указана
-        if status == 'DISMISSED' and not termination_date:
+        if dismissed and not termination_date:
             self.add_error('termination_date',
                           'Дата увольнения обязательна для уволенных сотрудников')
 
         # Если статус не увольнение, дата увольнения должна быть пуста
-        if status != 'DISMISSED' and termination_date:
+        elif not dismissed and termination_date:
             self.add_error('status',
                           'Дата увольнения может быть указана только для уволенных')
 
@@ -142,46 +230,37 @@ class EmployeeFilterForm(forms.Form):
     search = forms.CharField(
         required=False,
         label='Поиск',
-        widget=forms.TextInput(attrs={
-            'class': 'form-control',
-            'placeholder': 'ФИО, Email, табельный номер...'
-        })
+        widget=forms.TextInput(attrs={**FC, 'placeholder': 'ФИО, Email, табельный номер...'})
     )
-    department = forms.ModelChoiceField(
-        queryset=Department.objects.filter(is_active=True),
+    department = CachedModelChoiceField(
+        queryset=Department.objects.active().only('id', 'code', 'name'),
+        choices_cache_key=DEPARTMENT_CHOICES_CACHE_KEY,
         required=False,
         label='Отдел',
-        widget=forms.Select(attrs={
-            'class': 'form-control'
-        })
+        widget=forms.Select(attrs=FC)
     )
-    position = forms.ModelChoiceField(
-        queryset=Position.objects.filter(is_active=True),
+    position = CachedModelChoiceField(
+        queryset=Position.objects.active().only('id', 'name', 'level'),
+        choices_cache_key=POSITION_CHOICES_CACHE_KEY,
         required=False,
         label='Должность',
-        widget=forms.Select(attrs={
-            'class': 'form-control'
-        })
+        widget=forms.Select(attrs=FC)
     )
     status = forms.ChoiceField(
-        choices=[('', '---')] + Employee.STATUS_CHOICES,
+        choices=_STATUS_FILTER_CHOICES,
         required=False,
         label='Статус',
-        widget=forms.Select(attrs={
-            'class': 'form-control'
-        })
+        widget=forms.Select(attrs=FC)
     )
     is_contact = forms.ChoiceField(
-        choices=[('', '---'), ('true', 'Контактные лица'), ('false', 'Остальные')],
+        choices=_IS_CONTACT_CHOICES,
         required=False,
         label='Тип',
-        widget=forms.Select(attrs={
-            'class': 'form-control'
-        })
+        widget=forms.Select(attrs=FC)
     )
 
 
-class DepartmentForm(ModelForm):
+class DepartmentForm(ModelForm, metaclass=SharedFieldsModelFormMetaclass):
     """
     Форма для создания и редактирования отделов.
     Поддерживает иерархию отделов и назначение руководителей.
@@ -195,46 +274,19 @@ class DepartmentForm(ModelForm):
             'email', 'phone', 'office_location', 'is_active'
         ]
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Название отдела',
-                'required': True
-            }),
-            'code': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'ОТД-001',
-                'required': True
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 4,
-                'placeholder': 'Описание функций и ответственности'
-            }),
-            'parent_department': forms.Select(attrs={
-                'class': 'form-control'
-            }),
-            'head_of_department': forms.Select(attrs={
-                'class': 'form-control'
-            }),
-            'email': forms.EmailInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'department@university.ru'
-            }),
-            'phone': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': '+7 (495) 000-00-00'
-            }),
-            'office_location': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': '2 этаж, каб. 205'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
+            'name': forms.TextInput(attrs={**FC, 'placeholder': 'Название отдела'}),
+            'code': forms.TextInput(attrs={**FC, 'placeholder': 'ОТД-001'}),
+            'description': forms.Textarea(attrs={**FC, 'rows': 4, 'placeholder': 'Описание функций и ответственности'}),
+            'parent_department': forms.Select(attrs=FC),
+            'head_of_department': forms.Select(attrs=FC),
+            'email': forms.EmailInput(attrs={**FC, 'placeholder': 'department@university.ru'}),
+            'phone': forms.TextInput(attrs={**FC, 'placeholder': '+7 (495) 000-00-00'}),
+            'office_location': forms.TextInput(attrs={**FC, 'placeholder': '2 этаж, каб. 205'}),
+            'is_active': forms.CheckboxInput(attrs=FC_CHK),
         }
 
 
-class PositionForm(ModelForm):
+class PositionForm(ModelForm, metaclass=SharedFieldsModelFormMetaclass):
     """
     Форма для создания и редактирования должностей.
     Включает требования к квалификации, опыту и диапазон зарплаты.
@@ -248,52 +300,16 @@ class PositionForm(ModelForm):
             'salary_range_min', 'salary_range_max', 'is_active'
         ]
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Название должности',
-                'required': True
-            }),
-            'code': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'ДОЛЯ-001',
-                'required': True
-            }),
-            'level': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'department_category': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Педагогический',
-                'required': True
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 5,
-                'placeholder': 'Описание обязанностей и требований'
-            }),
-            'required_education': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Высшее образование'
-            }),
-            'required_experience_years': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'min': 0,
-                'placeholder': '5'
-            }),
-            'salary_range_min': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'step': '1000',
-                'placeholder': '50000'
-            }),
-            'salary_range_max': forms.NumberInput(attrs={
-                'class': 'form-control',
-                'step': '1000',
-                'placeholder': '100000'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
+            'name': forms.TextInput(attrs={**FC, 'placeholder': 'Название должности'}),
+            'code': forms.TextInput(attrs={**FC, 'placeholder': 'ДОЛЯ-001'}),
+            'level': forms.Select(attrs=FC),
+            'department_category': forms.TextInput(attrs={**FC, 'placeholder': 'Педагогический'}),
+            'description': forms.Textarea(attrs={**FC, 'rows': 5, 'placeholder': 'Описание обязанностей и требований'}),
+            'required_education': forms.TextInput(attrs={**FC, 'placeholder': 'Высшее образование'}),
+            'required_experience_years': forms.NumberInput(attrs={**FC, 'min': 0, 'placeholder': '5'}),
+            'salary_range_min': forms.NumberInput(attrs={**FC, 'step': '1000', 'placeholder': '50000'}),
+            'salary_range_max': forms.NumberInput(attrs={**FC, 'step': '1000', 'placeholder': '100000'}),
+            'is_active': forms.CheckboxInput(attrs=FC_CHK),
         }
 
 
@@ -309,34 +325,13 @@ class QualificationForm(ModelForm):
             'description', 'is_mandatory', 'is_active'
         ]
         widgets = {
-            'name': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Название квалификации',
-                'required': True
-            }),
-            'code': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'КВАЛ-001',
-                'required': True
-            }),
-            'type': forms.Select(attrs={
-                'class': 'form-control',
-                'required': True
-            }),
-            'issuing_organization': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'Организация-издатель'
-            }),
-            'description': forms.Textarea(attrs={
-                'class': 'form-control',
-                'rows': 3
-            }),
-            'is_mandatory': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
-            'is_active': forms.CheckboxInput(attrs={
-                'class': 'form-check-input'
-            }),
+            'name': forms.TextInput(attrs={**FC, 'placeholder': 'Название квалификации'}),
+            'code': forms.TextInput(attrs={**FC, 'placeholder': 'КВАЛ-001'}),
+            'type': forms.Select(attrs=FC),
+            'issuing_organization': forms.TextInput(attrs={**FC, 'placeholder': 'Организация-издатель'}),
+            'description': forms.Textarea(attrs={**FC, 'rows': 3}),
+            'is_mandatory': forms.CheckboxInput(attrs=FC_CHK),
+            'is_active': forms.CheckboxInput(attrs=FC_CHK),
         }
 
 
@@ -349,74 +344,10 @@ class EmployeeScheduleForm(ModelForm):
     class Meta:
         model = EmployeeSchedule
         fields = [
-            'monday_start', 'monday_end',
-            'tuesday_start', 'tuesday_end',
-            'wednesday_start', 'wednesday_end',
-            'thursday_start', 'thursday_end',
-            'friday_start', 'friday_end',
-            'saturday_start', 'saturday_end',
-            'sunday_start', 'sunday_end',
+            *SCHEDULE_TIME_FIELDS,
             'consultation_hours'
         ]
         widgets = {
-            'monday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'monday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'tuesday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'tuesday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'wednesday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'wednesday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'thursday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'thursday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'friday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'friday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'saturday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'saturday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'sunday_start': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'sunday_end': forms.TimeInput(attrs={
-                'class': 'form-control',
-                'type': 'time'
-            }),
-            'consultation_hours': forms.TextInput(attrs={
-                'class': 'form-control',
-                'placeholder': 'пн-чт 16:00-18:00, сб 10:00-12:00'
-            }),
+            **{name: forms.TimeInput(attrs=FC_TIME) for name in SCHEDULE_TIME_FIELDS},
+            'consultation_hours': forms.TextInput(attrs={**FC, 'placeholder': 'пн-чт 16:00-18:00, сб 10:00-12:00'}),
         }
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0005_remove_employee_hire_date_not_future_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['code', 'name'], name='department_active_order'),
+        ),
+        migrations.AddIndex(
+            model_name='position',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['level', 'name'], name='position_active_order'),
+        ),
+        migrations.AddIndex(
+            model_name='qualification',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['type', 'name'], name='qualification_active_order'),
+        ),
+    ]
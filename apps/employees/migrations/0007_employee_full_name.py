@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:31
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0006_choice_list_indexes'),
+    ]
+
+    operations = [
+        # CREATE EXTENSION IF NOT EXISTS pg_trgm — нужен для gin_trgm_ops
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='employee',
+            name='full_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('last_name', models.Value(' '), 'first_name', models.Value(' '), django.db.models.functions.comparison.Coalesce('middle_name', models.Value(''))), output_field=models.CharField(max_length=302)),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='employee_full_name_trgm'),
+        ),
+    ]
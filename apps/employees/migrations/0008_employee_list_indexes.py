@@ -0,0 +1,21 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0007_employee_full_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['status', 'department', 'last_name'], name='emp_status_dept_lname'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(condition=models.Q(('can_send_notifications', True), ('is_contact_person', True), ('status', 'ACTIVE')), fields=['department', 'last_name', 'id'], name='emp_contact_keyset'),
+        ),
+    ]
@@ -7,13 +7,23 @@
 информационные ресурсы предприятия.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Coalesce, Concat, Upper
 from django.core.validators import RegexValidator, URLValidator
 from django.utils import timezone
 from datetime import timedelta
 from django.conf import settings
 
 
+class ActiveQuerySet(models.QuerySet):
+    """QuerySet справочников с флагом is_active."""
+
+    def active(self):
+        """Только активные записи."""
+        return self.filter(is_active=True)
+
+
 class Department(models.Model):
     """
     Справочник отделений/факультетов учебного заведения.
@@ -83,6 +93,8 @@ class Department(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Отделение"
         verbose_name_plural = "Отделения"
@@ -91,6 +103,12 @@ class Department(models.Model):
         indexes = [
             models.Index(fields=['code', '-is_active']),
             models.Index(fields=['name']),
+            # Списки выбора в формах: активные отделения в порядке Meta.ordering
+            models.Index(
+                fields=['code', 'name'],
+                name='department_active_order',
+                condition=models.Q(is_active=True),
+            ),
         ]
 
     def __str__(self):
@@ -168,6 +186,8 @@ class Position(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Должность"
         verbose_name_plural = "Должности"
@@ -175,6 +195,12 @@ class Position(models.Model):
         indexes = [
             models.Index(fields=['code', '-is_active']),
             models.Index(fields=['department_category', 'level']),
+            # Списки выбора в формах: активные должности в порядке Meta.ordering
+            models.Index(
+                fields=['level', 'name'],
+                name='position_active_order',
+                condition=models.Q(is_active=True),
+            ),
         ]
 
     def __str__(self):
@@ -232,10 +258,20 @@ class Qualification(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActiveQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Квалификация"
         verbose_name_plural = "Квалификации"
         ordering = ['type', 'name']
+        indexes = [
+            # Списки выбора в формах: активные квалификации в порядке Meta.ordering
+            models.Index(
+                fields=['type', 'name'],
+                name='qualification_active_order',
+                condition=models.Q(is_active=True),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.get_type_display()})"
@@ -284,6 +320,15 @@ class Employee(models.Model):
         null=True,
         help_text="Отчество"
     )
+    # ФИО одной строкой (как get_full_name) — поиск по одному индексу вместо трёх колонок
+    full_name = models.GeneratedField(
+        expression=Concat(
+            'last_name', models.Value(' '), 'first_name', models.Value(' '),
+            Coalesce('middle_name', models.Value('')),
+        ),
+        output_field=models.CharField(max_length=302),
+        db_persist=True,
+    )
     date_of_birth = models.DateField(
         blank=True,
         null=True,
@@ -412,6 +457,19 @@ class Employee(models.Model):
             models.Index(fields=['email']),
             models.Index(fields=['position', 'status']),
             models.Index(fields=['department', '-hire_date']),
+            # Поиск по ФИО (full_name__icontains → UPPER(full_name) LIKE ...)
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='employee_full_name_trgm'),
+            # Остальные колонки поиска EmployeeListView: OR по icontains → BitmapOr по трём GIN
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='employee_email_trgm'),
+            GinIndex(OpClass(Upper('employee_id'), name='gin_trgm_ops'), name='employee_employee_id_trgm'),
+            # EmployeeListView: фильтр по статусу + сортировка (отдел, фамилия)
+            models.Index(fields=['status', 'department', 'last_name'], name='emp_status_dept_lname'),
+            # ContactPersonsListView: keyset-страницы (отдел, фамилия, id) среди контактных лиц
+            models.Index(
+                fields=['department', 'last_name', 'id'],
+                name='emp_contact_keyset',
+                condition=models.Q(is_contact_person=True, status='ACTIVE', can_send_notifications=True),
+            ),
         ]
         constraints = []
 
@@ -0,0 +1,137 @@
+"""
+Сигналы приложения employees.
+
+Сбрасывают закэшированные варианты выбора справочников (отделы, должности,
+квалификации) в формах и ответы API по сотруднику при изменении данных.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Department, Employee, Position, Qualification
+
+
+# Ключи кэша вариантов выбора (CachedModelChoiceField в forms.py)
+DEPARTMENT_CHOICES_CACHE_KEY = 'employees:department_choices'
+POSITION_CHOICES_CACHE_KEY = 'employees:position_choices'
+QUALIFICATION_CHOICES_CACHE_KEY = 'employees:qualification_choices'
+
+# Список активных отделов для фильтров в шаблонах (get_active_departments)
+ACTIVE_DEPARTMENTS_CACHE_KEY = 'employees:active_departments'
+ACTIVE_DEPARTMENTS_CACHE_TIMEOUT = 600
+
+# Версия списка отделов для фрагментного кэша {% cache %} в employee_list.html
+DEPARTMENT_LIST_VERSION_KEY = 'employees:department_list_version'
+
+# Нефильтрованный список сотрудников (EmployeeListView): число строк и страницы
+EMPLOYEE_LIST_VERSION_KEY = 'employees:employee_list_version'
+EMPLOYEE_LIST_CACHE_TIMEOUT = 30
+
+# Страницы списков отделов и должностей целиком (versioned_cache_page в urls.py)
+CATALOG_PAGES_VERSION_KEY = 'employees:catalog_pages_version'
+CATALOG_PAGES_CACHE_TIMEOUT = 300
+
+
+def employee_list_cache_key(suffix):
+    """
+    Ключ кэша нефильтрованного списка сотрудников ('count', 'page:<n>').
+    Включает версию: смена сотрудника, отдела или должности делает все ключи неактуальными.
+    """
+    version = cache.get_or_set(EMPLOYEE_LIST_VERSION_KEY, time.time_ns, None)
+    return f'employees:employee_list:{version}:{suffix}'
+
+
+def get_active_departments():
+    """Активные отделы (id, code, name) списком — из кэша, без SELECT на каждый запрос."""
+    return cache.get_or_set(
+        ACTIVE_DEPARTMENTS_CACHE_KEY,
+        lambda: list(Department.objects.active().only('id', 'code', 'name')),
+        ACTIVE_DEPARTMENTS_CACHE_TIMEOUT,
+    )
+
+
+def get_department_list_version():
+    """
+    Текущая версия списка отделов (входит в ключ фрагмента шаблона).
+
+    Начальное значение — метка времени, а не 1: после вытеснения ключа из кэша
+    старые фрагменты не совпадут с новой версией.
+    """
+    return cache.get_or_set(DEPARTMENT_LIST_VERSION_KEY, time.time_ns, None)
+
+
+def get_catalog_pages_version():
+    """Текущая версия кэшированных страниц списков отделов и должностей."""
+    return cache.get_or_set(CATALOG_PAGES_VERSION_KEY, time.time_ns, None)
+
+
+def api_employee_cache_key(employee_id):
+    """Ключ кэша ответа api_get_employee_by_id (табельный номер хэшируется: кириллица, пробелы)."""
+    digest = hashlib.md5(employee_id.encode(), usedforsecurity=False).hexdigest()
+    return f'employees:api_employee:{digest}'
+
+
+def contact_persons_count_cache_key(search, department_id):
+    """Ключ кэша числа контактных лиц для пары фильтров (поиск, отдел)."""
+    digest = hashlib.md5(f'{search}\x00{department_id}'.encode(), usedforsecurity=False).hexdigest()
+    return f'employees:contact_persons_count:{digest}'
+
+
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_department_choices(sender, **kwargs):
+    """Сбрасывает кэш списка отделов и меняет версию фрагментов шаблонов."""
+    cache.delete_many([DEPARTMENT_CHOICES_CACHE_KEY, ACTIVE_DEPARTMENTS_CACHE_KEY])
+    cache.set(DEPARTMENT_LIST_VERSION_KEY, time.time_ns(), None)
+
+
+@receiver([post_save, post_delete], sender=Position)
+def invalidate_position_choices(sender, **kwargs):
+    """Сбрасывает кэш списка должностей после изменения справочника."""
+    cache.delete(POSITION_CHOICES_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=Qualification)
+def invalidate_qualification_choices(sender, **kwargs):
+    """Сбрасывает кэш списка квалификаций после изменения справочника."""
+    cache.delete(QUALIFICATION_CHOICES_CACHE_KEY)
+
+
+@receiver(pre_save, sender=Employee)
+def remember_previous_employee_id(sender, instance, raw=False, **kwargs):
+    """Запоминает прежний табельный номер: при его смене нужно сбросить и старый ключ."""
+    if raw or instance.pk is None:
+        instance._previous_employee_id = None
+        return
+    instance._previous_employee_id = sender.objects.filter(pk=instance.pk).values_list(
+        'employee_id', flat=True
+    ).first()
+
+
+@receiver([post_save, post_delete], sender=Employee)
+def invalidate_api_employee(sender, instance, **kwargs):
+    """Сбрасывает закэшированный JSON сотрудника после изменения или удаления."""
+    keys = {api_employee_cache_key(instance.employee_id)}
+    previous = getattr(instance, '_previous_employee_id', None)
+    if previous:
+        keys.add(api_employee_cache_key(previous))
+    cache.delete_many(keys)
+
+
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Position)
+def invalidate_employee_list(sender, **kwargs):
+    """Меняет версию кэша списка сотрудников (в строках выводятся отдел и должность)."""
+    cache.set(EMPLOYEE_LIST_VERSION_KEY, time.time_ns(), None)
+
+
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Position)
+def invalidate_catalog_pages(sender, **kwargs):
+    """Меняет версию страниц списков отделов и должностей (в них выводится число сотрудников)."""
+    cache.set(CATALOG_PAGES_VERSION_KEY, time.time_ns(), None)
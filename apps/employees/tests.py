@@ -1,3 +1,24 @@
-from django.test import TestCase
+from django.test import RequestFactory, SimpleTestCase
 
-# Create your tests here.
+from .views import EmployeeListView
+
+
+class EmployeeListViewUnfilteredTests(SimpleTestCase):
+    """Определение нефильтрованного запроса списка сотрудников (быстрый путь с кэшем)."""
+
+    def _unfiltered(self, url):
+        view = EmployeeListView()
+        view.setup(RequestFactory().get(url))
+        return view._unfiltered
+
+    def test_bare_list_is_unfiltered(self):
+        self.assertTrue(self._unfiltered('/employees/'))
+        self.assertTrue(self._unfiltered('/employees/?page=2'))
+
+    def test_pagination_link_with_empty_filters_is_unfiltered(self):
+        # Ссылка «Вперёд ›» из employee_list.html без выбранных фильтров
+        self.assertTrue(self._unfiltered('/employees/?search=&department=&status=&page=2'))
+
+    def test_non_empty_filter_is_filtered(self):
+        self.assertFalse(self._unfiltered('/employees/?search=&department=1&status=&page=2'))
+        self.assertFalse(self._unfiltered('/employees/?search=L01'))
@@ -10,14 +10,27 @@ URL маршруты для модуля управления сотрудник
 Компетенция ПК-9: Разработка веб-приложений.
 """
 
-from django.urls import path
+from django.urls import path, register_converter
+from apps.core.decorators import versioned_cache_page
 from . import views
+from .converters import PositiveIntPKConverter
+from .signals import CATALOG_PAGES_CACHE_TIMEOUT, get_catalog_pages_version
+
+register_converter(PositiveIntPKConverter, 'pk')
 
 # Пространство имён для URL маршрутов (используется в шаблонах как {% url 'employees:employee_list' %})
 app_name = 'employees'
 
+# Списки отделов и должностей меняются редко: страница целиком кэшируется на сессию,
+# версия сбрасывается сигналами при изменении сотрудников, отделов и должностей
+catalog_page_cache = versioned_cache_page(
+    CATALOG_PAGES_CACHE_TIMEOUT, 'employees:catalog_page', get_catalog_pages_version
+)
+
+# Маршруты проверяются по порядку: самые частые (список, карточка, API) — первыми,
+# редкие операции изменения и экспорт — в конце
 urlpatterns = [
-    # ===== СОТРУДНИКИ - ОСНОВНЫЕ ОПЕРАЦИИ =====
+    # ===== СОТРУДНИКИ - СПИСОК И КАРТОЧКА =====
     # Получить список всех сотрудников с фильтрацией и поиском
     # URL: /employees/
     # Метод: GET
@@ -33,39 +46,50 @@ urlpatterns = [
     # Метод: GET
     # Permissions: login_required
     path(
-        'employees/<int:pk>/',
+        'employees/<pk:pk>/',
         views.EmployeeDetailView.as_view(),
         name='employee_detail'
     ),
     
-    # Создать новую запись о сотруднике
-    # URL: /employees/create/
-    # Метод: GET, POST
-    # Permissions: login_required, employees.add_employee
+    # ===== API ЭНДПОИНТЫ (для JavaScript и интеграции) =====
+    # API: Получить информацию о сотруднике по ID в формате JSON
+    # Используется для асинхронной загрузки данных во фронтенде
+    # Параметры: id (табельный номер сотрудника)
+    # Возвращает: JSON с полной информацией сотрудника
+    # Пример: /api/employee/?id=СОТ-001
+    # URL: /api/employee/
+    # Метод: GET
+    # Permissions: login_required
+    # Response: {"id": 1, "employee_id": "СОТ-001", "full_name": "...", ...}
     path(
-        'employees/create/',
-        views.EmployeeCreateView.as_view(),
-        name='employee_create'
+        'api/employee/',
+        views.api_get_employee_by_id,
+        name='api_get_employee'
     ),
     
-    # Редактировать информацию о сотруднике
-    # URL: /employees/<id>/edit/
-    # Метод: GET, POST
-    # Permissions: login_required, employees.change_employee
+    # ===== СПЕЦИАЛЬНЫЕ ПРЕДСТАВЛЕНИЯ =====
+    # Получить список контактных лиц для коммуникаций с родителями
+    # Фильтруются по статусу ACTIVE и флагу is_contact_person
+    # URL: /contact-persons/
+    # Метод: GET (с поддержкой фильтров: search, department; страницы: after=<id>)
+    # Permissions: login_required
+    # Используется: система отправки уведомлений родителям
     path(
-        'employees/<int:pk>/edit/',
-        views.EmployeeUpdateView.as_view(),
-        name='employee_update'
+        'contact-persons/',
+        views.ContactPersonsListView.as_view(),
+        name='contact_persons_list',
+        kwargs={'_cache_s': 30}  # RouteCacheControlMiddleware: private, max-age=30
     ),
     
-    # Удалить/отключить сотрудника (soft-delete)
-    # URL: /employees/<id>/delete/
-    # Метод: GET, POST
-    # Permissions: login_required, employees.delete_employee
+    # Получить расписание работы конкретного сотрудника
+    # Показывает рабочие часы и время консультаций с родителями
+    # URL: /employees/<id>/schedule/
+    # Метод: GET
+    # Permissions: login_required
     path(
-        'employees/<int:pk>/delete/',
-        views.EmployeeDeleteView.as_view(),
-        name='employee_delete'
+        'employees/<pk:pk>/schedule/',
+        views.employee_schedule_view,
+        name='employee_schedule'
     ),
     
     # ===== ОТДЕЛЕНИЯ (DEPARTMENTS) =====
@@ -75,7 +99,7 @@ urlpatterns = [
     # Permissions: login_required
     path(
         'departments/',
-        views.DepartmentListView.as_view(),
+        catalog_page_cache(views.DepartmentListView.as_view()),
         name='department_list'
     ),
     
@@ -84,7 +108,7 @@ urlpatterns = [
     # Метод: GET
     # Permissions: login_required
     path(
-        'departments/<int:pk>/',
+        'departments/<pk:pk>/',
         views.DepartmentDetailView.as_view(),
         name='department_detail'
     ),
@@ -96,48 +120,39 @@ urlpatterns = [
     # Permissions: login_required
     path(
         'positions/',
-        views.PositionListView.as_view(),
+        catalog_page_cache(views.PositionListView.as_view()),
         name='position_list'
     ),
     
-    # ===== СПЕЦИАЛЬНЫЕ ПРЕДСТАВЛЕНИЯ =====
-    # Получить список контактных лиц для коммуникаций с родителями
-    # Фильтруются по статусу ACTIVE и флагу is_contact_person
-    # URL: /contact-persons/
-    # Метод: GET (с поддержкой фильтров: search, department)
-    # Permissions: login_required
-    # Используется: система отправки уведомлений родителям
+    # ===== СОТРУДНИКИ - ИЗМЕНЕНИЕ =====
+    # Создать новую запись о сотруднике
+    # URL: /employees/create/
+    # Метод: GET, POST
+    # Permissions: login_required, employees.add_employee
     path(
-        'contact-persons/',
-        views.contact_persons_list,
-        name='contact_persons_list'
+        'employees/create/',
+        views.EmployeeCreateView.as_view(),
+        name='employee_create'
     ),
     
-    # Получить расписание работы конкретного сотрудника
-    # Показывает рабочие часы и время консультаций с родителями
-    # URL: /employees/<id>/schedule/
-    # Метод: GET
-    # Permissions: login_required
+    # Редактировать информацию о сотруднике
+    # URL: /employees/<id>/edit/
+    # Метод: GET, POST
+    # Permissions: login_required, employees.change_employee
     path(
-        'employees/<int:pk>/schedule/',
-        views.employee_schedule_view,
-        name='employee_schedule'
+        'employees/<pk:pk>/edit/',
+        views.EmployeeUpdateView.as_view(),
+        name='employee_update'
     ),
     
-    # ===== API ЭНДПОИНТЫ (для JavaScript и интеграции) =====
-    # API: Получить информацию о сотруднике по ID в формате JSON
-    # Используется для асинхронной загрузки данных во фронтенде
-    # Параметры: id (табельный номер сотрудника)
-    # Возвращает: JSON с полной информацией сотрудника
-    # Пример: /api/employee/?id=СОТ-001
-    # URL: /api/employee/
-    # Метод: GET
-    # Permissions: login_required
-    # Response: {"id": 1, "employee_id": "СОТ-001", "full_name": "...", ...}
+    # Удалить/отключить сотрудника (soft-delete)
+    # URL: /employees/<id>/delete/
+    # Метод: GET, POST
+    # Permissions: login_required, employees.delete_employee
     path(
-        'api/employee/',
-        views.api_get_employee_by_id,
-        name='api_get_employee'
+        'employees/<pk:pk>/delete/',
+        views.EmployeeDeleteView.as_view(),
+        name='employee_delete'
     ),
     
     # ===== ЭКСПОРТ ДАННЫХ =====
@@ -151,6 +166,7 @@ urlpatterns = [
     path(
         'export/employees-csv/',
         views.export_employees_list,
-        name='export_employees_csv'
+        name='export_employees_csv',
+        kwargs={'_cache_s': 120}  # RouteCacheControlMiddleware: private, max-age=120
     ),
 ]
@@ -6,22 +6,57 @@
 ПК-7: Способность разрабатывать бизнес-приложения, используя высокоуровневые методы программирования.
 """
 
+import csv
+import io
+from datetime import datetime
+from itertools import islice
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required, permission_required
-from django.http import JsonResponse, HttpResponseForbidden
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.generic import (
     ListView, DetailView, CreateView, UpdateView, DeleteView
 )
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Prefetch
 from django.urls import reverse_lazy
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.contrib import messages
-from django.core.paginator import Paginator
-from .models import Employee, Department, Position, Qualification, EmployeeSchedule
+from django.core.cache import cache
+from .converters import parse_pk
+from .models import Employee, Department, Position, Qualification
 from .forms import (
-    EmployeeForm, EmployeeFilterForm, DepartmentForm, 
+    EmployeeForm, DepartmentForm, 
     PositionForm, QualificationForm, EmployeeScheduleForm
 )
+from .signals import (
+    EMPLOYEE_LIST_CACHE_TIMEOUT, api_employee_cache_key, contact_persons_count_cache_key,
+    employee_list_cache_key,
+    get_active_departments, get_department_list_version,
+)
+
+# Ответ api_get_employee_by_id: поля строки и время жизни кэша (вызывается автодополнением)
+API_EMPLOYEE_FIELDS = (
+    'id', 'employee_id', 'last_name', 'first_name', 'middle_name',
+    'position__name', 'department__name', 'email', 'phone', 'is_contact_person',
+)
+API_EMPLOYEE_CACHE_TIMEOUT = 30
+
+# Сортировка списка сотрудников: department_id, а не department —
+# иначе сортировка идёт по Meta.ordering отдела через JOIN
+EMPLOYEE_LIST_ORDERING = ('department_id', 'last_name')
+
+# Поля строки списка контактных лиц (ContactPersonsListView, через values())
+CONTACT_PERSON_FIELDS = (
+    'id', 'last_name', 'first_name', 'middle_name', 'email', 'phone',
+    'position__name', 'department__name',
+)
+
+# Время жизни закэшированного числа контактных лиц (по фильтрам; сигналами не сбрасывается)
+CONTACT_PERSONS_COUNT_CACHE_TIMEOUT = 60
+
+# Размер порции строк при потоковом экспорте CSV
+EXPORT_CHUNK_SIZE = 2000
 
 
 class EmployeeListView(LoginRequiredMixin, ListView):
@@ -33,29 +68,43 @@ class EmployeeListView(LoginRequiredMixin, ListView):
     template_name = 'employees/employee_list.html'
     context_object_name = 'employees'
     paginate_by = 20
-    queryset = Employee.objects.select_related('position', 'department').prefetch_related('qualifications')
+    # Только колонки, которые выводит employee_list.html (квалификации в списке не показываются)
+    queryset = Employee.objects.select_related('position', 'department').only(
+        'id', 'employee_id', 'first_name', 'last_name', 'middle_name', 'email',
+        'status', 'is_contact_person', 'department__name', 'position__name',
+    )
+
+    @cached_property
+    def _unfiltered(self):
+        """
+        Запрос без фильтров (допускается только номер страницы) — самый частый случай.
+        Пустые значения не считаются фильтром: ссылки пагинации и форма фильтров
+        всегда передают search=&department=&status=.
+        """
+        return not any(value for key, value in self.request.GET.items() if key != 'page')
+
+    @cached_property
+    def _department_id(self):
+        """Выбранный отдел (?department=); некорректное значение игнорируется."""
+        return parse_pk(self.request.GET.get('department'))
 
     def get_queryset(self):
         """
         Получить queryset с фильтрацией по поисковому запросу и фильтрам.
         """
         queryset = super().get_queryset()
-        
+        if self._unfiltered:
+            return queryset.order_by(*EMPLOYEE_LIST_ORDERING)
+
         # Поиск по ФИО, email, ID сотрудника
         search_query = self.request.GET.get('search', '')
         if search_query:
             queryset = queryset.filter(
-                Q(last_name__icontains=search_query) |
-                Q(first_name__icontains=search_query) |
+                Q(full_name__icontains=search_query) |
                 Q(email__icontains=search_query) |
                 Q(employee_id__icontains=search_query)
             )
         
-        # Фильтр по отделу
-        department_id = self.request.GET.get('department')
-        if department_id:
-            queryset = queryset.filter(department_id=department_id)
-        
         # Фильтр по должности
         position_id = self.request.GET.get('position')
         if position_id:
@@ -70,18 +119,55 @@ class EmployeeListView(LoginRequiredMixin, ListView):
         is_contact = self.request.GET.get('is_contact')
         if is_contact == 'true':
             queryset = queryset.filter(is_contact_person=True, status='ACTIVE')
-        
-        return queryset.order_by('department', 'last_name')
+
+        # Отделы, в которых есть совпадения по остальным фильтрам — варианты выпадающего списка
+        self._department_facet_qs = queryset
+
+        # Фильтр по отделу
+        if self._department_id:
+            queryset = queryset.filter(department_id=self._department_id)
+
+        return queryset.order_by(*EMPLOYEE_LIST_ORDERING)
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Для нефильтрованного списка число сотрудников берётся из кэша."""
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        if self._unfiltered:
+            paginator.count = cache.get_or_set(
+                employee_list_cache_key('count'), queryset.count, EMPLOYEE_LIST_CACHE_TIMEOUT
+            )
+        return paginator
+
+    def paginate_queryset(self, queryset, page_size):
+        """Строки страницы нефильтрованного списка кэшируются на EMPLOYEE_LIST_CACHE_TIMEOUT."""
+        paginator, page, object_list, is_paginated = super().paginate_queryset(queryset, page_size)
+        if self._unfiltered:
+            page.object_list = object_list = cache.get_or_set(
+                employee_list_cache_key(f'page:{page.number}'),
+                lambda: list(page.object_list),
+                EMPLOYEE_LIST_CACHE_TIMEOUT,
+            )
+        return paginator, page, object_list, is_paginated
 
     def get_context_data(self, **kwargs):
         """
         Добавить в контекст фильтры и поисковый запрос.
         """
         context = super().get_context_data(**kwargs)
-        context['departments'] = Department.objects.filter(is_active=True)
-        context['positions'] = Position.objects.filter(is_active=True)
+        if self._unfiltered:
+            # Ленивый список: кэш читается только при промахе фрагментного кэша шаблона
+            context['departments'] = SimpleLazyObject(get_active_departments)
+        else:
+            # При фильтрах — только отделы с совпадениями (и выбранный), без кэша
+            department_filter = Q(pk__in=self._department_facet_qs.values('department_id'))
+            if self._department_id:
+                department_filter |= Q(pk=self._department_id)
+            context['departments'] = Department.objects.active().filter(
+                department_filter
+            ).only('id', 'code', 'name')
+            context['departments_faceted'] = True
+        context['departments_version'] = get_department_list_version()
         context['search_query'] = self.request.GET.get('search', '')
-        context['filter_form'] = EmployeeFilterForm(self.request.GET)
         return context
 
 
@@ -93,17 +179,21 @@ class EmployeeDetailView(LoginRequiredMixin, DetailView):
     model = Employee
     template_name = 'employees/employee_detail.html'
     context_object_name = 'employee'
-    queryset = Employee.objects.select_related('position', 'department').prefetch_related('qualifications')
+    # Шаблон выводит только название квалификации
+    queryset = Employee.objects.select_related(
+        'position', 'department', 'schedule'
+    ).prefetch_related(
+        Prefetch('qualifications', queryset=Qualification.objects.only('id', 'name'))
+    )
 
     def get_context_data(self, **kwargs):
         """
         Добавить в контекст расписание и дополнительные данные.
         """
         context = super().get_context_data(**kwargs)
-        try:
-            context['schedule'] = self.object.schedule
-        except EmployeeSchedule.DoesNotExist:
-            context['schedule'] = None
+        # Расписание загружено select_related; при его отсутствии обращение не идёт в БД
+        # (RelatedObjectDoesNotExist — подкласс AttributeError)
+        context['schedule'] = getattr(self.object, 'schedule', None)
         
         context['years_of_service'] = self.object.get_years_of_service()
         context['age'] = self.object.get_age()
@@ -153,6 +243,11 @@ class EmployeeUpdateView(LoginRequiredMixin, PermissionRequiredMixin, UpdateView
     template_name = 'employees/employee_form.html'
     permission_required = 'employees.change_employee'
     success_url = reverse_lazy('employees:employee_list')
+    # Отмеченные квалификации (initial для флажков) — из кэша prefetch, только id;
+    # сами варианты выбора EmployeeForm берёт из кэша (CachedModelMultipleChoiceField)
+    queryset = Employee.objects.prefetch_related(
+        Prefetch('qualifications', queryset=Qualification.objects.only('id'))
+    )
 
     def form_valid(self, form):
         """
@@ -207,17 +302,38 @@ class DepartmentListView(LoginRequiredMixin, ListView):
     template_name = 'employees/department_list.html'
     context_object_name = 'departments'
     paginate_by = 15
-    queryset = Department.objects.filter(is_active=True).select_related('head_of_department', 'parent_department')
+    queryset = Department.objects.active().select_related(
+        'head_of_department', 'parent_department'
+    ).annotate(
+        employee_count=Count('employees', filter=Q(employees__status='ACTIVE'))
+    ).order_by('code', 'name')  # Meta.ordering не применяется к запросам с GROUP BY
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Пагинатор без отдельного COUNT: число отделов уже посчитано в _stats."""
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        paginator.count = self._stats['total']
+        return paginator
+
+    @cached_property
+    def _stats(self):
+        """Число активных отделов и отделов с активными сотрудниками — одним запросом."""
+        return Department.objects.active().aggregate(
+            total=Count('id', distinct=True),
+            with_employees=Count('id', filter=Q(employees__status='ACTIVE'), distinct=True),
+        )
 
     def get_context_data(self, **kwargs):
         """
         Добавить статистику по отделам.
+        Счётчики — из одного агрегата, число сотрудников по отделу — из аннотации списка.
         """
         context = super().get_context_data(**kwargs)
-        context['departments_count'] = Department.objects.filter(is_active=True).count()
-        context['departments_with_employees'] = Department.objects.annotate(
-            employee_count=Count('employees')
-        ).filter(is_active=True, employee_count__gt=0)
+        context['departments_count'] = self._stats['total']
+        context['departments_with_employees_count'] = self._stats['with_employees']
+        # Только отделы текущей страницы; общее число — departments_with_employees_count
+        context['page_departments_with_employees'] = [
+            department for department in context['departments'] if department.employee_count
+        ]
         return context
 
 
@@ -228,15 +344,29 @@ class DepartmentDetailView(LoginRequiredMixin, DetailView):
     model = Department
     template_name = 'employees/department_detail.html'
     context_object_name = 'department'
-    queryset = Department.objects.select_related('head_of_department', 'parent_department')
+    # Активные сотрудники (с должностью и отделом) и подразделения — тремя запросами вместе с отделом
+    queryset = Department.objects.select_related(
+        'head_of_department', 'parent_department'
+    ).prefetch_related(
+        Prefetch(
+            'employees',
+            queryset=Employee.objects.filter(status='ACTIVE').select_related('position', 'department'),
+            to_attr='active_employees',
+        ),
+        Prefetch(
+            'subdepartments',
+            queryset=Department.objects.active(),
+            to_attr='active_subdepartments',
+        ),
+    )
 
     def get_context_data(self, **kwargs):
         """
         Добавить сотрудников отдела и подразделения.
         """
         context = super().get_context_data(**kwargs)
-        context['employees'] = self.object.employees.filter(status='ACTIVE')
-        context['subdepartments'] = self.object.subdepartments.filter(is_active=True)
+        context['employees'] = self.object.active_employees
+        context['subdepartments'] = self.object.active_subdepartments
         return context
 
 
@@ -248,59 +378,117 @@ class PositionListView(LoginRequiredMixin, ListView):
     template_name = 'employees/position_list.html'
     context_object_name = 'positions'
     paginate_by = 20
-    queryset = Position.objects.filter(is_active=True)
+    queryset = Position.objects.active().annotate(
+        employee_count=Count('employees', filter=Q(employees__status='ACTIVE'))
+    ).order_by('level', 'name')  # Meta.ordering не применяется к запросам с GROUP BY
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        """Пагинатор без отдельного COUNT: число должностей уже посчитано в _stats."""
+        paginator = super().get_paginator(queryset, per_page, **kwargs)
+        paginator.count = self._stats['total']
+        return paginator
+
+    @cached_property
+    def _stats(self):
+        """Число активных должностей и должностей с активными сотрудниками — одним запросом."""
+        return Position.objects.active().aggregate(
+            total=Count('id', distinct=True),
+            with_employees=Count('id', filter=Q(employees__status='ACTIVE'), distinct=True),
+        )
 
     def get_context_data(self, **kwargs):
         """
         Добавить статистику по должностям.
+        Счётчики — из одного агрегата, число сотрудников по должности — из аннотации списка.
         """
         context = super().get_context_data(**kwargs)
-        context['positions_count'] = Position.objects.filter(is_active=True).count()
-        context['positions_with_employees'] = Position.objects.annotate(
-            employee_count=Count('employees')
-        ).filter(is_active=True, employee_count__gt=0)
+        context['positions_count'] = self._stats['total']
+        context['positions_with_employees_count'] = self._stats['with_employees']
+        # Только должности текущей страницы; общее число — positions_with_employees_count
+        context['page_positions_with_employees'] = [
+            position for position in context['positions'] if position.employee_count
+        ]
         return context
 
 
-@login_required
-def contact_persons_list(request):
+class ContactPersonsListView(LoginRequiredMixin, ListView):
     """
     Специальное представление для вывода только активных контактных лиц.
     Используется в системе коммуникаций для отправки уведомлений родителям.
+
+    Строки читаются через values() без создания моделей; постраничный вывод —
+    keyset по (отдел, фамилия, id): ?after=<id последней строки> вместо OFFSET.
     """
-    contact_persons = Employee.objects.filter(
-        is_contact_person=True,
-        status='ACTIVE',
-        can_send_notifications=True
-    ).select_related('position', 'department').order_by('department', 'last_name')
-    
-    # Поиск
-    search_query = request.GET.get('search', '')
-    if search_query:
-        contact_persons = contact_persons.filter(
-            Q(last_name__icontains=search_query) |
-            Q(first_name__icontains=search_query) |
-            Q(department__name__icontains=search_query)
+    template_name = 'employees/contact_persons_list.html'
+    context_object_name = 'contact_persons'
+    page_size = 25
+
+    @cached_property
+    def _filtered_qs(self):
+        """Контактные лица с учётом поиска и фильтра по отделу (без сортировки и курсора)."""
+        params = self.request.GET
+        queryset = Employee.objects.filter(
+            is_contact_person=True,
+            status='ACTIVE',
+            can_send_notifications=True
         )
-    
-    # Фильтр по отделу
-    department_id = request.GET.get('department')
-    if department_id:
-        contact_persons = contact_persons.filter(department_id=department_id)
-    
-    paginator = Paginator(contact_persons, 25)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
-    context = {
-        'page_obj': page_obj,
-        'contact_persons': page_obj.object_list,
-        'search_query': search_query,
-        'departments': Department.objects.filter(is_active=True),
-        'total_count': paginator.count,
-    }
-    
-    return render(request, 'employees/contact_persons_list.html', context)
+
+        # Поиск
+        self._search = params.get('search', '')
+        if self._search:
+            queryset = queryset.filter(
+                Q(full_name__icontains=self._search) |
+                Q(department__name__icontains=self._search)
+            )
+
+        # Фильтр по отделу
+        self._department_id = parse_pk(params.get('department')) or ''
+        if self._department_id:
+            queryset = queryset.filter(department_id=self._department_id)
+
+        return queryset
+
+    def get_queryset(self):
+        queryset = self._filtered_qs
+        self._after = parse_pk(self.request.GET.get('after'))
+
+        if self._after:
+            # Позиция последней строки предыдущей страницы (поиск по PK)
+            anchor = Employee.objects.filter(pk=self._after).values_list(
+                'department_id', 'last_name'
+            ).first()
+            if anchor:
+                department_id, last_name = anchor
+                queryset = queryset.filter(
+                    Q(department_id__gt=department_id) |
+                    Q(department_id=department_id, last_name__gt=last_name) |
+                    Q(department_id=department_id, last_name=last_name, id__gt=self._after)
+                )
+
+        # Лишняя строка показывает, есть ли следующая страница
+        return queryset.values(*CONTACT_PERSON_FIELDS).order_by(
+            'department_id', 'last_name', 'id'
+        )[:self.page_size + 1]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        rows = list(context['contact_persons'])
+        has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        context.update({
+            'contact_persons': rows,
+            'next_after': rows[-1]['id'] if has_next else None,
+            'is_first_page': not self._after,
+            'search_query': self._search,
+            'departments': get_active_departments(),
+            # COUNT по тем же фильтрам не повторяется при листании страниц
+            'total_count': cache.get_or_set(
+                contact_persons_count_cache_key(self._search, self._department_id),
+                self._filtered_qs.count,
+                CONTACT_PERSONS_COUNT_CACHE_TIMEOUT,
+            ),
+        })
+        return context
 
 
 @login_required
@@ -309,11 +497,9 @@ def employee_schedule_view(request, pk):
     Представление для просмотра расписания сотрудника.
     Показывает рабочие часы и время консультаций с родителями.
     """
-    employee = get_object_or_404(Employee, pk=pk)
-    try:
-        schedule = employee.schedule
-    except EmployeeSchedule.DoesNotExist:
-        schedule = None
+    # Сотрудник, должность и расписание одним запросом (JOIN)
+    employee = get_object_or_404(Employee.objects.select_related('schedule', 'position'), pk=pk)
+    schedule = getattr(employee, 'schedule', None)
     
     context = {
         'employee': employee,
@@ -332,49 +518,66 @@ def api_get_employee_by_id(request):
     employee_id = request.GET.get('id')
     if not employee_id:
         return JsonResponse({'error': 'ID не указан'}, status=400)
-    
-    try:
-        employee = Employee.objects.get(employee_id=employee_id, status='ACTIVE')
-        return JsonResponse({
-            'id': employee.id,
-            'employee_id': employee.employee_id,
-            'full_name': employee.get_full_name(),
-            'position': employee.position.name,
-            'department': employee.department.name,
-            'email': employee.email,
-            'phone': employee.phone,
-            'is_contact_person': employee.is_contact_person,
-        })
-    except Employee.DoesNotExist:
-        return JsonResponse({'error': 'Сотрудник не найден'}, status=404)
+
+    def load_payload():
+        # values(): одна строка без создания экземпляров модели и связанных объектов
+        row = Employee.objects.filter(
+            employee_id=employee_id, status='ACTIVE'
+        ).values(*API_EMPLOYEE_FIELDS).first()
+        if row is None:
+            return None
+        middle = f" {row['middle_name']}" if row['middle_name'] else ""
+        return {
+            'id': row['id'],
+            'employee_id': row['employee_id'],
+            'full_name': f"{row['last_name']} {row['first_name']}{middle}",
+            'position': row['position__name'],
+            'department': row['department__name'],
+            'email': row['email'],
+            'phone': row['phone'],
+            'is_contact_person': row['is_contact_person'],
+        }
+
+    cache_key = api_employee_cache_key(employee_id)
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = load_payload()
+        if payload is None:
+            # Отсутствующие сотрудники не кэшируются: get() не отличает сохранённый None от промаха
+            return JsonResponse({'error': 'Сотрудник не найден'}, status=404)
+        cache.set(cache_key, payload, API_EMPLOYEE_CACHE_TIMEOUT)
+    return JsonResponse(payload)
 
 
 @login_required
+@permission_required('employees.view_employee', raise_exception=True)
 def export_employees_list(request):
     """
     Экспорт списка сотрудников в CSV для аналитики и отчётности.
+    Строки отдаются потоком по мере чтения из БД — память не растёт с числом сотрудников.
     """
-    import csv
-    from datetime import datetime
-    
-    employees = Employee.objects.filter(status='ACTIVE').select_related(
-        'position', 'department'
-    ).values_list(
+    employees = Employee.objects.filter(status='ACTIVE').values_list(
         'employee_id', 'last_name', 'first_name', 'position__name',
         'department__name', 'email', 'phone', 'hire_date'
-    )
-    
-    response = HttpResponseForbidden() if not request.user.has_perm('employees.view_employee') else None
-    if response:
-        return response
-    
-    response = HttpResponse(content_type='text/csv')
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=';')
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    def rows():
+        writer.writerow(['Табельный №', 'Фамилия', 'Имя', 'Должность', 'Отдел', 'Email', 'Телефон', 'Дата найма'])
+        yield flush()
+        # writerows() обходит порцию в C, а не вызовом writerow() на каждую строку
+        for batch in iter(lambda: list(islice(employees, EXPORT_CHUNK_SIZE)), []):
+            writer.writerows(batch)
+            yield flush()
+
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
     response['Content-Disposition'] = f'attachment; filename="employees_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-    
-    writer = csv.writer(response, delimiter=';')
-    writer.writerow(['Табельный №', 'Фамилия', 'Имя', 'Должность', 'Отдел', 'Email', 'Телефон', 'Дата найма'])
-    
-    for employee in employees:
-        writer.writerow(employee)
-    
     return response
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ParentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.parents'
+
+    def ready(self):
+        # Регистрация обработчиков сигналов (сброс кэша справочников)
+        from . import signals  # noqa: F401
@@ -0,0 +1,33 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parents', '0003_alter_parentstudentrelation_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='parent',
+            index=models.Index(fields=['-registered_at'], name='parent_reg_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='parent',
+            index=models.Index(fields=['can_receive_notifications', '-registered_at'], name='parents_par_can_rec_b79146_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parent',
+            index=models.Index(fields=['gender', '-registered_at'], name='parents_par_gender_dd97bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parentstudentrelation',
+            index=models.Index(fields=['-start_date'], name='parents_par_start_d_18742a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parentstudentrelation',
+            index=models.Index(fields=['relation_type', '-start_date'], name='parents_par_relatio_a949ef_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:14
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parents', '0004_parent_relation_list_indexes'),
+    ]
+
+    operations = [
+        # CREATE EXTENSION IF NOT EXISTS pg_trgm — нужен для gin_trgm_ops
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='parent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('first_name'), name='gin_trgm_ops'), name='parent_first_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='parent',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('last_name'), name='gin_trgm_ops'), name='parent_last_name_trgm'),
+        ),
+    ]
@@ -8,7 +8,9 @@
 Компетенция ПК-7: Разработка бизнес-приложений.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.core.validators import RegexValidator
 from django.utils import timezone
 from django.conf import settings
@@ -295,6 +297,13 @@ class Parent(models.Model):
             models.Index(fields=['email']),
             models.Index(fields=['phone']),
             models.Index(fields=['status', '-registered_at']),
+            # Составные индексы под фильтры и сортировку ParentListView
+            models.Index(fields=['-registered_at'], name='parent_reg_desc'),
+            models.Index(fields=['can_receive_notifications', '-registered_at']),
+            models.Index(fields=['gender', '-registered_at']),
+            # Триграммные индексы под поиск icontains (UPPER(...) LIKE '%...%')
+            GinIndex(OpClass(Upper('first_name'), name='gin_trgm_ops'), name='parent_first_name_trgm'),
+            GinIndex(OpClass(Upper('last_name'), name='gin_trgm_ops'), name='parent_last_name_trgm'),
         ]
 
     def __str__(self):
@@ -388,6 +397,11 @@ class ParentStudentRelation(models.Model):
         ordering = ['parent', 'is_primary_contact']
         # Один родитель не может иметь две связи с одним студентом одного типа
         unique_together = [['parent', 'student', 'relation_type']]
+        # Индексы под сортировку и фильтры ParentStudentRelationListView
+        indexes = [
+            models.Index(fields=['-start_date']),
+            models.Index(fields=['relation_type', '-start_date']),
+        ]
 
         def __str__(self):
             return f"{self.parent.get_full_name()} ({self.relation_type.name}) - {self.student.full_name}"
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Сигналы приложения parents.
+
+Сбрасывают закэшированные справочники при их изменении.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import RelationType
+
+
+# Ключ кэша списка активных типов связей (фильтр в ParentStudentRelationListView)
+ACTIVE_RELATION_TYPES_CACHE_KEY = 'parents:active_relation_types'
+
+
+@receiver([post_save, post_delete], sender=RelationType)
+def invalidate_relation_types_cache(sender, **kwargs):
+    """Сбрасывает кэш типов связей после изменения справочника."""
+    cache.delete(ACTIVE_RELATION_TYPES_CACHE_KEY)
@@ -23,9 +23,22 @@ from django.views.generic import (
 from django.urls import reverse_lazy
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Prefetch, Q
+from django.http import Http404
+from django.utils import timezone
 from .models import Parent, ParentStudentRelation, RelationType
 from .forms import ParentForm, ParentStudentRelationForm, RelationTypeForm
+from .signals import ACTIVE_RELATION_TYPES_CACHE_KEY
+
+
+# Допустимые значения фильтров (frozenset — проверка за O(1) без пересоздания списка)
+_VALID_STATUS = frozenset(code for code, _ in Parent.STATUS_CHOICES)
+_VALID_GENDER = frozenset(code for code, _ in Parent.GENDER_CHOICES)
+
+# Время жизни кэша справочника типов связей (сек.)
+RELATION_TYPES_CACHE_TIMEOUT = 300
 
 
 # ===== PARENT VIEWS =====
@@ -52,9 +65,10 @@ class ParentListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         """Получает queryset с фильтрацией и поиском."""
         queryset = Parent.objects.all().order_by('-registered_at')
+        params = self.request.GET
         
         # Поиск по ФИО, email, телефону
-        search = self.request.GET.get('search', '').strip()
+        search = params.get('search', '').strip()
         if search:
             queryset = queryset.filter(
                 Q(first_name__icontains=search) |
@@ -64,20 +78,20 @@ class ParentListView(LoginRequiredMixin, ListView):
             )
         
         # Фильтр по статусу
-        status = self.request.GET.get('status', '').strip()
-        if status and status in ['ACTIVE', 'INACTIVE', 'DECEASED']:
+        status = params.get('status', '').strip()
+        if status in _VALID_STATUS:
             queryset = queryset.filter(status=status)
         
         # Фильтр по согласию на уведомления
-        notifications = self.request.GET.get('notifications', '').strip()
+        notifications = params.get('notifications', '').strip()
         if notifications == 'yes':
             queryset = queryset.filter(can_receive_notifications=True)
         elif notifications == 'no':
             queryset = queryset.filter(can_receive_notifications=False)
         
         # Фильтр по гендеру
-        gender = self.request.GET.get('gender', '').strip()
-        if gender and gender in ['M', 'F']:
+        gender = params.get('gender', '').strip()
+        if gender in _VALID_GENDER:
             queryset = queryset.filter(gender=gender)
         
         return queryset
@@ -85,11 +99,12 @@ class ParentListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         """Добавляет дополнительный контекст для фильтров."""
         context = super().get_context_data(**kwargs)
-        context['search'] = self.request.GET.get('search', '')
-        context['status'] = self.request.GET.get('status', '')
-        context['notifications'] = self.request.GET.get('notifications', '')
-        context['gender'] = self.request.GET.get('gender', '')
-        context['statuses'] = Parent._meta.get_field('status').choices
+        params = self.request.GET
+        context['search'] = params.get('search', '')
+        context['status'] = params.get('status', '')
+        context['notifications'] = params.get('notifications', '')
+        context['gender'] = params.get('gender', '')
+        context['statuses'] = Parent.STATUS_CHOICES
         return context
 
 
@@ -108,13 +123,28 @@ class ParentDetailView(LoginRequiredMixin, DetailView):
     model = Parent
     template_name = 'parents/parent_detail.html'
     context_object_name = 'parent'
+    # Только поля, которые выводит шаблон, + активные связи одним запросом
+    queryset = Parent.objects.only(
+        'id', 'first_name', 'last_name', 'middle_name',
+        'email', 'phone', 'status', 'can_receive_notifications', 'registered_at',
+    ).prefetch_related(
+        Prefetch(
+            'student_relations',
+            queryset=ParentStudentRelation.objects.filter(
+                is_active=True
+            ).select_related('relation_type', 'student').only(
+                'id', 'parent', 'is_active',
+                'student__id', 'student__full_name', 'student__student_id',
+                'relation_type__id', 'relation_type__name',
+            ),
+            to_attr='active_student_relations',
+        )
+    )
     
     def get_context_data(self, **kwargs):
         """Добавляет связанные студенты и дополнительный контекст."""
         context = super().get_context_data(**kwargs)
-        context['student_relations'] = self.object.student_relations.filter(
-            is_active=True
-        ).select_related('relation_type')
+        context['student_relations'] = self.object.active_student_relations
         return context
 
 
@@ -193,18 +223,35 @@ class ParentDeleteView(LoginRequiredMixin, DeleteView):
     template_name = 'parents/parent_confirm_delete.html'
     success_url = reverse_lazy('parents:parent-list')
     
-    def delete(self, request, *args, **kwargs):
-        """Вместо удаления деактивирует родителя."""
-        self.object = self.get_object()
-        parent_name = self.object.get_full_name()
-        self.object.status = 'INACTIVE'
-        self.object.save()
+    def post(self, request, *args, **kwargs):
+        """
+        Вместо удаления деактивирует родителя.
+        
+        Один запрос UPDATE ... RETURNING: статус меняется и ФИО для
+        сообщения возвращается без предварительного SELECT.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {Parent._meta.db_table} '
+                'SET status = %s, updated_at = %s WHERE id = %s '
+                'RETURNING last_name, first_name, middle_name',
+                ['INACTIVE', timezone.now(), kwargs['pk']],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise Http404('Родитель не найден')
+        
+        last_name, first_name, middle_name = row
+        middle = f" {middle_name}" if middle_name else ""
         messages.success(
             request,
-            f'Родитель {parent_name} деактивирован.'
+            f'Родитель {last_name} {first_name}{middle} деактивирован.'
         )
         return redirect(self.success_url)
     
+    # HTTP DELETE обрабатывается так же, как POST из формы подтверждения
+    delete = post
+    
     def get_context_data(self, **kwargs):
         """Добавляет информацию в контекст удаления."""
         context = super().get_context_data(**kwargs)
@@ -232,28 +279,36 @@ class ParentStudentRelationListView(LoginRequiredMixin, ListView):
     
     def get_queryset(self):
         """Получает queryset с поиском и фильтрацией."""
+        # Студенты, родители и типы связей — одним JOIN, только выводимые колонки
         queryset = ParentStudentRelation.objects.all().select_related(
             'parent', 'relation_type', 'student'
+        ).only(
+            'id', 'is_active', 'is_primary_contact', 'start_date',
+            'parent__id', 'parent__first_name', 'parent__last_name', 'parent__middle_name',
+            'student__id', 'student__full_name',
+            'relation_type__id', 'relation_type__name',
         ).order_by('-start_date')
+        params = self.request.GET
         
-        # Поиск по ФИО родителя или ID студента
-        search = self.request.GET.get('search', '').strip()
+        # Поиск по ФИО родителя, ФИО или номеру студента
+        search = params.get('search', '').strip()
         if search:
             queryset = queryset.filter(
                 Q(parent__first_name__icontains=search) |
                 Q(parent__last_name__icontains=search) |
-                Q(student__full_name__icontains=search)
+                Q(student__full_name__icontains=search) |
+                Q(student__student_id__iexact=search)
             )
         
         # Фильтр по активности
-        is_active = self.request.GET.get('is_active', '').strip()
+        is_active = params.get('is_active', '').strip()
         if is_active == 'yes':
             queryset = queryset.filter(is_active=True)
         elif is_active == 'no':
             queryset = queryset.filter(is_active=False)
         
         # Фильтр по типу связи
-        relation_type = self.request.GET.get('relation_type', '').strip()
+        relation_type = params.get('relation_type', '').strip()
         if relation_type:
             queryset = queryset.filter(relation_type_id=relation_type)
         
@@ -262,9 +317,14 @@ class ParentStudentRelationListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         """Добавляет дополнительный контекст для фильтров."""
         context = super().get_context_data(**kwargs)
-        context['search'] = self.request.GET.get('search', '')
-        context['is_active'] = self.request.GET.get('is_active', '')
-        context['relation_types'] = RelationType.objects.filter(is_active=True)
+        params = self.request.GET
+        context['search'] = params.get('search', '')
+        context['is_active'] = params.get('is_active', '')
+        context['relation_types'] = cache.get_or_set(
+            ACTIVE_RELATION_TYPES_CACHE_KEY,
+            lambda: list(RelationType.objects.filter(is_active=True)),
+            RELATION_TYPES_CACHE_TIMEOUT,
+        )
         return context
 
 
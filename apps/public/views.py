@@ -1,41 +1,99 @@
-from django.contrib.auth.decorators import login_required
+from functools import wraps
+from pathlib import Path
+
+from django.contrib.auth.decorators import login_required, user_passes_test
+from django.core.exceptions import PermissionDenied
+from django.db.models import Count, Max
 from django.http import HttpResponse, Http404
 from django.shortcuts import render, redirect, get_object_or_404
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_POST
 
 from .forms import FeedbackForm
 from .models import Feedback, News
 
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64 KB
+
+PAGES = {
+    "about": ("О проекте", "public/pages/about.html"),
+    "features": ("Возможности", "public/pages/features.html"),
+    "roles": ("Роли", "public/pages/roles.html"),
+    "security": ("Безопасность", "public/pages/security.html"),
+    "docs": ("Документация", "public/pages/docs.html"),
+    "faq": ("FAQ", "public/pages/faq.html"),
+    "sitemap": ("Карта сайта", "public/pages/sitemap.html"),
+    "privacy": ("Политика ПДн", "public/pages/privacy.html"),
+    "terms": ("Пользовательское соглашение", "public/pages/terms.html"),
+}
+
+# Версия статических страниц: последнее изменение шаблонов приложения (на момент деплоя)
+_TEMPLATES_VERSION = int(max(
+    (f.stat().st_mtime for f in (Path(__file__).resolve().parent / "templates").rglob("*.html")),
+    default=0,
+))
+
+PAGE_MAX_AGE = 60 * 60  # 1 час
+NEWS_MAX_AGE = 5 * 60  # 5 минут
+STALE_WHILE_REVALIDATE = 24 * 60 * 60  # 1 сутки
+
 
 def _public_base_context(title, breadcrumbs):
     return {"page_title": title, "breadcrumbs": breadcrumbs}
 
 
+def _public_cache(max_age):
+    """
+    Заголовки кэширования для публичных страниц.
+
+    Гостям — public (браузер/CDN), авторизованным — private с обязательной
+    ревалидацией по ETag: разметка отличается (ссылка «Вход» в меню).
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            response = view_func(request, *args, **kwargs)
+            if request.user.is_authenticated:
+                patch_cache_control(response, private=True, no_cache=True)
+            else:
+                patch_cache_control(
+                    response,
+                    public=True,
+                    max_age=max_age,
+                    stale_while_revalidate=STALE_WHILE_REVALIDATE,
+                )
+            return response
+        return _wrapped
+    return decorator
+
+
+def _page_etag(request, slug):
+    return f"page-{slug}-{_TEMPLATES_VERSION}-{int(request.user.is_authenticated)}"
+
+
+def _news_etag(request):
+    stats = News.objects.filter(is_published=True).aggregate(last=Max("published_at"), total=Count("id"))
+    last = int(stats["last"].timestamp()) if stats["last"] else 0
+    return f"news-{last}-{stats['total']}-{_TEMPLATES_VERSION}-{int(request.user.is_authenticated)}"
+
+
 def index(request):
     ctx = _public_base_context("Главная", [("Главная", None)])
     return render(request, "public/index.html", ctx)
 
 
+@_public_cache(PAGE_MAX_AGE)
+@condition(etag_func=_page_etag)
 def page(request, slug):
-    pages = {
-        "about": ("О проекте", "public/pages/about.html"),
-        "features": ("Возможности", "public/pages/features.html"),
-        "roles": ("Роли", "public/pages/roles.html"),
-        "security": ("Безопасность", "public/pages/security.html"),
-        "docs": ("Документация", "public/pages/docs.html"),
-        "faq": ("FAQ", "public/pages/faq.html"),
-        "sitemap": ("Карта сайта", "public/pages/sitemap.html"),
-        "privacy": ("Политика ПДн", "public/pages/privacy.html"),
-        "terms": ("Пользовательское соглашение", "public/pages/terms.html"),
-    }
-
-    if slug not in pages:
+    if slug not in PAGES:
         raise Http404()
 
-    title, template = pages[slug]
+    title, template = PAGES[slug]
     ctx = _public_base_context(title, [("Главная", "/"), (title, None)])
     return render(request, template, ctx)
 
 
+@_public_cache(NEWS_MAX_AGE)
+@condition(etag_func=_news_etag)
 def news_list(request):
     items = News.objects.filter(is_published=True)
     ctx = _public_base_context("Новости", [("Главная", "/"), ("Новости", None)])
@@ -53,8 +111,12 @@ def contacts(request):
             if f:
                 fb.file_name = f.name
                 fb.file_content_type = getattr(f, "content_type", "") or ""
-                fb.file_size = f.size
-                fb.file_data = f.read()
+                # Читаем вложение частями: временный файл не загружается в память целиком
+                buf = bytearray()
+                for chunk in f.chunks(chunk_size=UPLOAD_CHUNK_SIZE):
+                    buf.extend(chunk)
+                fb.file_size = len(buf)
+                fb.file_data = buf
 
             fb.save()
             return redirect("public:contacts_success", public_id=fb.public_id)
@@ -82,29 +144,36 @@ def _is_admin(user):
     return getattr(user, "role", None) == "admin"
 
 
+def _role_required(check):
+    """Пропускает только пользователей, прошедших check; иначе 403 (PermissionDenied)."""
+    def test(user):
+        if check(user):
+            return True
+        raise PermissionDenied
+    return user_passes_test(test)
+
+
+staff_role_required = _role_required(_is_staff_role)
+admin_required = _role_required(_is_admin)
+
+
 @login_required
+@staff_role_required
 def staff_feedback_list(request):
-    if not _is_staff_role(request.user):
-        return HttpResponse("Доступ запрещён", status=403)
-
     items = Feedback.objects.all()
     return render(request, "public/staff/feedback_list.html", {"items": items})
 
 
 @login_required
+@staff_role_required
 def staff_feedback_detail(request, public_id):
-    if not _is_staff_role(request.user):
-        return HttpResponse("Доступ запрещён", status=403)
-
     fb = get_object_or_404(Feedback, public_id=public_id)
     return render(request, "public/staff/feedback_detail.html", {"fb": fb})
 
 
 @login_required
+@admin_required
 def staff_feedback_attachment(request, public_id):
-    if not _is_admin(request.user):
-        return HttpResponse("Доступ запрещён", status=403)
-
     fb = get_object_or_404(Feedback, public_id=public_id)
     if not fb.file_data:
         raise Http404()
@@ -116,11 +185,9 @@ def staff_feedback_attachment(request, public_id):
 
 
 @login_required
+@staff_role_required
+@require_POST
 def staff_feedback_mark_processed(request, public_id):
-    if not _is_staff_role(request.user):
-        return HttpResponse("Доступ запрещён", status=403)
-    if request.method != 'POST':
-        return HttpResponse("Method Not Allowed", status=405)
     fb = get_object_or_404(Feedback, public_id=public_id)
     fb.status = Feedback.STATUS_PROCESSED
     fb.save(update_fields=['status'])
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-15 22:14
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # pg_trgm создаётся в parents.0005
+        ('parents', '0005_trigram_search_indexes'),
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='student',
+            options={'verbose_name': 'Студент', 'verbose_name_plural': 'Студенты'},
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name'), name='gin_trgm_ops'), name='student_full_name_trgm'),
+        ),
+    ]
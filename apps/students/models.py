@@ -1,4 +1,6 @@
-﻿from django.db import models
+﻿from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 
 from apps.parents.models import Parent
@@ -28,6 +30,10 @@ class Student(models.Model):
     class Meta:
         verbose_name = "Студент"
         verbose_name_plural = "Студенты"
+        indexes = [
+            # Триграммный индекс под поиск связей по ФИО студента (icontains)
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='student_full_name_trgm'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.student_id})"
@@ -67,6 +67,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.core.middleware.RouteCacheControlMiddleware",
 ]
 
 ROOT_URLCONF = "college_portal.urls"
@@ -90,7 +91,6 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "college_portal.wsgi.application"
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 
 # ------------------------------------------------------------------------------
@@ -108,6 +108,31 @@ DATABASES = {
 }
 
 
+# ------------------------------------------------------------------------------
+# CACHE
+# ------------------------------------------------------------------------------
+# Общий кэш для всех воркеров gunicorn: сигналы сбрасывают ключи и версии,
+# и это должно быть видно каждому процессу (LocMemCache у каждого свой).
+# В production задаётся REDIS_URL; без него (локальная разработка, один
+# процесс runserver) — кэш в памяти процесса.
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 
 # ------------------------------------------------------------------------------
 # PASSWORD VALIDATION
@@ -141,6 +166,18 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, "static"),
 ]
 
+# Статику раздаёт WhiteNoise: файлы с хэшем в имени, заранее сжатые
+# (gzip + brotli) на этапе collectstatic.
+# STATICFILES_STORAGE удалён в Django 5.1 — хранилища задаются через STORAGES.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
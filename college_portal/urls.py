@@ -25,7 +25,7 @@
    - 500 Server Error → server_error()
 
 5. СТАТИЧЕСКИЕ И МЕДИА ФАЙЛЫ:
-   - /static/ → CSS, JS, изображения
+   - /static/ → CSS, JS, изображения (WhiteNoise)
    - /media/ → Загруженные данные (в разработке)
 
 НОМЕНКЛАТУРА:
@@ -40,6 +40,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from apps.core.views import page_not_found, server_error
+
 
 
 # ==============================================================================
@@ -84,12 +86,11 @@ urlpatterns = [
 
 
 # ==============================================================================
-# СТАТИЧЕСКИЕ МЕДИА ФАЙЛЫ (ДЛЯ DEBUG=True)
+# МЕДИА ФАЙЛЫ (ДЛЯ DEBUG=True)
 # ==============================================================================
 
+# Статические файлы (CSS, JS) раздаёт WhiteNoise (см. STORAGES в settings.py)
 if settings.DEBUG:
-    # Обслуживание статических файлов (CSS, JS)
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
     # Обслуживание медиа файлов (загруженные изображения)
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
@@ -97,11 +98,14 @@ if settings.DEBUG:
 # ОБРАБОТЧИКИ ОШИБОК
 # ==============================================================================
 
+# Обработчики передаются вызываемыми объектами, а не строками —
+# Django не разрешает путь через import_string на каждой ошибке.
+
 # 404 - Страница не найдена
-handler404 = 'apps.core.views.page_not_found'
+handler404 = page_not_found
 
 # 500 - Ошибка сервера
-handler500 = 'apps.core.views.server_error'
+handler500 = server_error
 
 # ==============================================================================
 # НОМЕНКЛАТУРА ГОТОВЫМ К ПОДКЛЮЧЕНИЮ (РАСКОММЕНТИРОВАТЬ):
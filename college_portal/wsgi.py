@@ -10,7 +10,16 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'college_portal.settings')
 
 application = get_wsgi_application()
+
+# Прогрев URL-резолвера при старте воркера (с gunicorn --preload — один раз
+# в мастер-процессе до fork): импорт URLconf и всех views, компиляция
+# шаблонов маршрутов и сборка reverse_dict не ложатся на первый запрос.
+# Здесь, а не в AppConfig.ready(), чтобы не нагружать manage.py-команды.
+_resolver = get_resolver()
+_resolver.url_patterns
+_resolver._populate()